@@ -0,0 +1,80 @@
+"""
+Agent service entry point - Run a registered agent as a microservice
+
+The deployer runs this module with AGENT_ID, SERVICE_PORT and an optional
+SERVICE_CONFIG (JSON) in the environment, or forks _run_agent_service.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict
+
+from agents.agent_registry import get_registry
+from agents.agent_server import create_agent_app
+
+def run_service(agent_id: str, port: int, config: Dict[str, Any]) -> int:
+    """Serve a registered agent over HTTP and return the exit code"""
+    # Configure logging here rather than at import, so the deployer can import this module
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger = logging.getLogger(f"agent_service_{agent_id}")
+
+    try:
+        # Get agent from registry
+        registry = get_registry()
+
+        # Discover agents if not already done
+        registry.discover_agents()
+
+        # Get agent instance
+        agent_instance = registry.get_agent_instance(agent_id)
+        if not agent_instance:
+            logger.error("Failed to create agent instance")
+            return 1
+
+        # Create Flask app
+        app = create_agent_app(agent_instance)
+        app.config.update(config)
+
+        # Run service
+        logger.info(f"Starting agent service on port {port}")
+        app.run(
+            host='0.0.0.0',
+            port=port,
+            debug=False,
+            threaded=True
+        )
+
+    except KeyboardInterrupt:
+        logger.info("Service stopped by user")
+        return 0
+    except Exception as e:
+        logger.error(f"Service failed: {e}")
+        return 1
+
+    return 0
+
+
+def _run_agent_service(agent_id: str, port: int, config: Dict[str, Any]):
+    """Run a service forked from the deployer's forkserver"""
+    # Own process group, matching start_new_session for exec'd services
+    os.setsid()
+    sys.exit(run_service(agent_id, port, config))
+
+
+def main() -> int:
+    """Run the service configured in the environment"""
+    return run_service(
+        os.environ["AGENT_ID"],
+        int(os.environ["SERVICE_PORT"]),
+        json.loads(os.environ.get("SERVICE_CONFIG") or "{}")
+    )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
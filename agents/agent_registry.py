@@ -36,6 +36,9 @@ class AgentRegistry:
         self.metadata: Dict[str, Dict[str, Any]] = {}
         self.load_paths: Set[str] = set()
         self.dependencies: Dict[str, List[str]] = {}
+        # Bumped whenever an agent class is (re)registered or an instance is stopped,
+        # so callers holding on to instances know to look them up again
+        self.instance_version = 0
         
     def register_agent(self, agent_class: Type[BaseAgent], metadata: Dict[str, Any] = None):
         """
@@ -54,6 +57,7 @@ class AgentRegistry:
             agent_id = temp_instance.config.agent_id
             
             self.agents[agent_id] = agent_class
+            self.instance_version += 1
             self.metadata[agent_id] = {
                 "class_name": agent_class.__name__,
                 "module": agent_class.__module__,
@@ -130,6 +134,7 @@ class AgentRegistry:
                     logger.warning(f"Agent {agent_id} cleanup failed: {e}")
             
             del self.instances[agent_id]
+            self.instance_version += 1
             logger.info(f"Stopped agent instance: {agent_id}")
     
     def list_agents(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -5,19 +5,50 @@ This module provides a high-level interface for submitting jobs and automaticall
 determining the best execution strategy using teams, individual agents, or microservices.
 """
 import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, Union
+import pickle
+from typing import Dict, List, Any, Optional, Union, Hashable
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import uuid
 import json
 
+import httpx
+
 from .team_orchestrator import TeamOrchestrator, JobRequirement, get_orchestrator
 from .microservice_deployer import MicroserviceDeployer, get_deployer
 from .agent_registry import get_registry
 
 logger = logging.getLogger('juniorgpt.job_dispatcher')
 
+# Maps an explicit JobRequest.execution_strategy onto the plan strategy name
+FORCED_STRATEGIES = {
+    "single": "single_agent",
+    "team": "team_collaboration",
+    "microservice": "microservice",
+    "hybrid": "hybrid"
+}
+
+# Upper bound on memoized can_handle results before the cache is reset
+CAN_HANDLE_CACHE_SIZE = 1024
+
+def _hash_context(context: Dict[str, Any]) -> Hashable:
+    """
+    Build a stable cache key for a job context
+    
+    Contexts holding only hashable values use their sorted items directly;
+    anything else falls back to a digest of the pickled context.
+    """
+    if not context:
+        return ()
+    try:
+        key = tuple(sorted(context.items()))
+        hash(key)
+        return key
+    except TypeError:
+        return hashlib.blake2b(pickle.dumps(context, protocol=5), digest_size=16).digest()
+
 @dataclass
 class JobRequest:
     """High-level job request"""
@@ -53,6 +84,24 @@ class ExecutionPlan:
         result['created_at'] = self.created_at.isoformat()
         return result
 
+async def _call_microservice(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    description: str,
+    context: Dict[str, Any],
+    timeout: int
+) -> Dict[str, Any]:
+    """Send a job to a deployed agent microservice and return its JSON reply"""
+    response = await client.post(
+        f"{endpoint}/process",
+        json={
+            "message": description,
+            "context": context
+        },
+        timeout=timeout
+    )
+    return response.json()
+
 class JobDispatcher:
     """
     Central job dispatch and coordination system
@@ -74,6 +123,12 @@ class JobDispatcher:
         self.active_jobs: Dict[str, Dict[str, Any]] = {}
         self.execution_history: List[Dict[str, Any]] = []
         
+        # Memoized can_handle scores keyed by (agent class, description, context key)
+        self._can_handle_cache: Dict[tuple, float] = {}
+        
+        # Shared HTTP client for microservice calls (created on first use)
+        self._http_client: Optional[httpx.AsyncClient] = None
+        
         # Strategy weights (can be tuned based on performance)
         self.strategy_weights = {
             "team_collaboration": 0.3,
@@ -136,6 +191,10 @@ class JobDispatcher:
         """
         logger.info("Creating execution plan...")
         
+        # Caller already chose a strategy - skip analysis and evaluation entirely
+        if job_request.execution_strategy != "auto":
+            return self._build_forced_plan(job_request)
+        
         # Analyze job characteristics
         job_analysis = self._analyze_job_complexity(job_request)
         
@@ -162,9 +221,77 @@ class JobDispatcher:
         logger.info(f"Selected strategy: {execution_plan.strategy} (confidence: {execution_plan.confidence:.2f})")
         return execution_plan
     
+    def _build_forced_plan(self, job_request: JobRequest) -> ExecutionPlan:
+        """
+        Build execution plan for a caller-selected strategy
+        
+        Args:
+            job_request: Job request with explicit execution_strategy
+            
+        Returns:
+            Execution plan
+        """
+        strategy = FORCED_STRATEGIES.get(job_request.execution_strategy)
+        if not strategy:
+            raise ValueError(f"Unknown execution strategy: {job_request.execution_strategy}")
+        
+        if strategy == "single_agent":
+            # Only strategy that needs a concrete agent up front
+            best_agent = None
+            best_score = 0
+            get_agent_class = self.registry.get_agent_class
+            for agent_id in self._get_available_agents():
+                agent_class = get_agent_class(agent_id)
+                if not agent_class:
+                    continue
+                try:
+                    score = self._cached_can_handle(agent_class, job_request.description, job_request.context)
+                except Exception:
+                    continue
+                if best_agent is None or score > best_score:
+                    best_agent, best_score = agent_id, score
+            if not best_agent:
+                raise RuntimeError("No agents available for single agent execution")
+            agents = [best_agent]
+            estimated_time = 60
+            resources = {"agents": 1, "memory": "low", "cpu": "low"}
+        
+        elif strategy == "team_collaboration":
+            # Orchestrator forms the team when the plan executes
+            agents = []
+            estimated_time = 120
+            resources = {"memory": "medium", "cpu": "medium"}
+        
+        elif strategy == "microservice":
+            services = self._get_available_microservices()
+            if not services:
+                raise RuntimeError("No running microservices available")
+            agents = services[:1]
+            estimated_time = 30
+            resources = {"services": 1, "memory": "high", "cpu": "high"}
+        
+        else:
+            agents = self._get_available_agents()[:2] + self._get_available_microservices()[:1]
+            estimated_time = 90
+            resources = {"agents": 2, "services": 1, "memory": "high", "cpu": "high"}
+        
+        execution_plan = ExecutionPlan(
+            plan_id=str(uuid.uuid4()),
+            strategy=strategy,
+            agents=agents,
+            estimated_time=estimated_time,
+            confidence=1.0,
+            resources_required=resources,
+            created_at=datetime.utcnow()
+        )
+        
+        logger.info(f"Using requested strategy: {execution_plan.strategy}")
+        return execution_plan
+    
     def _analyze_job_complexity(self, job_request: JobRequest) -> Dict[str, Any]:
         """Analyze job complexity and characteristics"""
         description = job_request.description.lower()
+        num_requirements = len(job_request.requirements)
         
         # Complexity indicators
         complexity_score = 0
@@ -172,7 +299,7 @@ class JobDispatcher:
             complexity_score += 1
         if any(word in description for word in ["complex", "detailed", "comprehensive", "thorough"]):
             complexity_score += 2
-        if len(job_request.requirements) > 3:
+        if num_requirements > 3:
             complexity_score += 1
         
         # Collaboration indicators
@@ -194,7 +321,7 @@ class JobDispatcher:
             "collaboration_benefit": min(collaboration_score, 5),
             "urgency": min(urgency_score, 5),
             "estimated_tokens": len(description.split()) * 4,  # Rough estimate
-            "requires_specialization": len(job_request.requirements) > 0
+            "requires_specialization": num_requirements > 0
         }
     
     def _get_available_agents(self) -> List[str]:
@@ -259,12 +386,17 @@ class JobDispatcher:
         best_agent = None
         best_score = 0
         
+        # Bind hot lookups once; this loop runs for every registered agent
+        get_agent_class = self.registry.get_agent_class
+        cached_can_handle = self._cached_can_handle
+        description = job_request.description
+        context = job_request.context
+        
         for agent_id in available_agents:
             try:
-                agent_class = self.registry.get_agent_class(agent_id)
+                agent_class = get_agent_class(agent_id)
                 if agent_class:
-                    temp_instance = agent_class()
-                    score = temp_instance.can_handle(job_request.description, job_request.context)
+                    score = cached_can_handle(agent_class, description, context)
                     
                     if score > best_score:
                         best_score = score
@@ -277,13 +409,15 @@ class JobDispatcher:
         
         # Calculate strategy score
         strategy_score = best_score * 0.8  # Base agent capability
+        complexity = job_analysis['complexity']
+        collaboration_benefit = job_analysis['collaboration_benefit']
         
         # Bonus for simplicity
-        if job_analysis['complexity'] <= 2:
+        if complexity <= 2:
             strategy_score += 0.2
         
         # Penalty for jobs that benefit from collaboration
-        if job_analysis['collaboration_benefit'] > 3:
+        if collaboration_benefit > 3:
             strategy_score -= 0.3
         
         return {
@@ -294,6 +428,23 @@ class JobDispatcher:
             "resources": {"agents": 1, "memory": "low", "cpu": "low"}
         }
     
+    def _cached_can_handle(self, agent_class, description: str, context: Dict[str, Any]) -> float:
+        """Score an agent class for a request, reusing earlier results for identical inputs"""
+        try:
+            key = (agent_class, description, _hash_context(context))
+        except Exception:
+            # Unpicklable context - score without caching
+            return agent_class().can_handle(description, context)
+        
+        score = self._can_handle_cache.get(key)
+        if score is None:
+            score = agent_class().can_handle(description, context)
+            if len(self._can_handle_cache) >= CAN_HANDLE_CACHE_SIZE:
+                self._can_handle_cache.clear()
+            self._can_handle_cache[key] = score
+        
+        return score
+    
     async def _evaluate_team_strategy(
         self, 
         job_request: JobRequest, 
@@ -469,22 +620,19 @@ class JobDispatcher:
             raise RuntimeError(f"Service {service_id} not found")
         
         # Call microservice endpoint
-        import httpx
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{deployment['endpoint']}/process",
-                json={
-                    "message": job_request.description,
-                    "context": job_request.context
-                },
-                timeout=job_request.timeout
-            )
-            
-            if response.status_code != 200:
-                raise RuntimeError(f"Service call failed: {response.status_code}")
-            
-            result = response.json()
+        response = await self._get_http_client().post(
+            f"{deployment['endpoint']}/process",
+            json={
+                "message": job_request.description,
+                "context": job_request.context
+            },
+            timeout=job_request.timeout
+        )
+        
+        if response.status_code != 200:
+            raise RuntimeError(f"Service call failed: {response.status_code}")
+        
+        result = response.json()
         
         return {
             "execution_type": "microservice",
@@ -519,20 +667,13 @@ class JobDispatcher:
             service_id = services[0]
             deployment = self.deployer.get_deployment(service_id)
             if deployment:
-                import httpx
-                async def call_service():
-                    async with httpx.AsyncClient() as client:
-                        response = await client.post(
-                            f"{deployment['endpoint']}/process",
-                            json={
-                                "message": job_request.description,
-                                "context": job_request.context
-                            },
-                            timeout=job_request.timeout
-                        )
-                        return response.json()
-                
-                tasks.append(("service", call_service()))
+                tasks.append(("service", _call_microservice(
+                    self._get_http_client(),
+                    deployment['endpoint'],
+                    job_request.description,
+                    job_request.context,
+                    job_request.timeout
+                )))
         
         # Execute all tasks
         results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
@@ -551,6 +692,18 @@ class JobDispatcher:
             "services": services
         }
     
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get shared HTTP client, creating it on first use"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient()
+        return self._http_client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get job status and results"""
         return self.active_jobs.get(job_id)
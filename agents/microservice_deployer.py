@@ -5,24 +5,51 @@ This module handles the deployment and management of agents as standalone
 microservices, enabling true modularity and independent scaling.
 """
 import asyncio
-import subprocess
+import heapq
 import logging
+import multiprocessing
 import json
 import socket
 import time
 import os
 import signal
+import sys
+import httpx
 import yaml
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Set, Tuple
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+try:
+    # libyaml bindings when available
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 from .agent_registry import get_registry
 from .agent_server import create_agent_app
 
 logger = logging.getLogger('juniorgpt.microservice_deployer')
 
+# Module run by every agent service process (see agents/_service_entrypoint.py)
+SERVICE_ENTRYPOINT = "agents._service_entrypoint"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Readiness polling backoff bounds (seconds)
+READY_POLL_INITIAL_DELAY = 0.05
+READY_POLL_MAX_DELAY = 2.0
+
+# Container healthcheck run with the image's own interpreter (no curl needed)
+HEALTHCHECK_SCRIPT = (
+    "import sys, urllib.request; "
+    "sys.exit(0 if urllib.request.urlopen({url!r}, timeout=3).status == 200 else 1)"
+)
+
+# Modules imported once by the forkserver so forked services start warm
+FORKSERVER_PRELOAD = ['flask', 'httpx', 'agents.agent_registry', 'agents.agent_server']
+
 @dataclass
 class ServiceDeployment:
     """Represents a deployed agent microservice"""
@@ -37,9 +64,44 @@ class ServiceDeployment:
     health_check_url: str
     
     def to_dict(self) -> Dict[str, Any]:
-        result = asdict(self)
-        result['deployed_at'] = self.deployed_at.isoformat()
-        return result
+        # Built by hand - asdict() deep-copies config on every call
+        return {
+            'service_id': self.service_id,
+            'agent_id': self.agent_id,
+            'port': self.port,
+            'process_id': self.process_id,
+            'endpoint': self.endpoint,
+            'status': self.status,
+            'deployed_at': self.deployed_at.isoformat(),
+            'config': self.config,
+            'health_check_url': self.health_check_url
+        }
+
+class ForkedServiceProcess:
+    """
+    Forkserver-started service with the same surface as asyncio.subprocess.Process
+    
+    Lets the deployer manage forked and exec'd services through one code path.
+    """
+    
+    def __init__(self, process: multiprocessing.Process):
+        self._process = process
+        self.pid = process.pid
+    
+    @property
+    def returncode(self) -> Optional[int]:
+        return self._process.exitcode
+    
+    def terminate(self):
+        self._process.terminate()
+    
+    def kill(self):
+        self._process.kill()
+    
+    async def wait(self) -> int:
+        """Wait for the process to exit without blocking the event loop"""
+        await asyncio.get_running_loop().run_in_executor(None, self._process.join)
+        return self._process.exitcode
 
 class MicroserviceDeployer:
     """
@@ -54,14 +116,32 @@ class MicroserviceDeployer:
     - Auto-scaling
     """
     
-    def __init__(self, base_port: int = 8000, max_services: int = 100):
+    def __init__(self, base_port: int = 8000, max_services: int = 100, use_forkserver: bool = False):
         self.base_port = base_port
         self.max_services = max_services
         self.registry = get_registry()
         
+        # Optionally fork services from a pre-warmed forkserver instead of exec'ing python
+        self._mp_context = None
+        if use_forkserver:
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                self._mp_context = multiprocessing.get_context('forkserver')
+                self._mp_context.set_forkserver_preload(FORKSERVER_PRELOAD)
+            else:
+                logger.warning("forkserver start method unavailable, falling back to exec")
+        
         # Track deployed services
         self.deployments: Dict[str, ServiceDeployment] = {}
         self.port_allocations: Dict[int, str] = {}  # port -> service_id
+        self._free_ports: List[int] = list(range(base_port, base_port + max_services))
+        heapq.heapify(self._free_ports)
+        self.processes: Dict[str, Any] = {}  # service_id -> asyncio or forked process
+        self._by_agent: Dict[str, Set[str]] = defaultdict(set)  # agent_id -> service_ids
+        self._log_drains: Dict[str, List[asyncio.Task]] = {}  # service_id -> stdout/stderr readers
+        self._dict_cache: Dict[str, Dict[str, Any]] = {}  # service_id -> to_dict(), refreshed on change
+        
+        # Shared HTTP client for health probes (created inside the running loop)
+        self._http: Optional[httpx.AsyncClient] = None
         
         # Configuration
         self.deployment_configs = self._load_deployment_configs()
@@ -79,17 +159,33 @@ class MicroserviceDeployer:
         if config_path.exists():
             try:
                 with open(config_path) as f:
-                    return yaml.safe_load(f) or {}
+                    return yaml.load(f, Loader=SafeLoader) or {}
             except Exception as e:
                 logger.warning(f"Failed to load deployment configs: {e}")
         return {}
     
     def _find_available_port(self) -> Optional[int]:
         """Find an available port for service deployment"""
-        for port in range(self.base_port, self.base_port + self.max_services):
-            if port not in self.port_allocations and self._is_port_available(port):
-                return port
-        return None
+        # Ports taken by something outside the deployer go back on the heap for later
+        busy = []
+        port = None
+        
+        while self._free_ports:
+            candidate = heapq.heappop(self._free_ports)
+            if self._is_port_available(candidate):
+                port = candidate
+                break
+            busy.append(candidate)
+        
+        for candidate in busy:
+            heapq.heappush(self._free_ports, candidate)
+        
+        return port
+    
+    def _release_port(self, port: int):
+        """Return a port to the free pool"""
+        if self.port_allocations.pop(port, None) is not None:
+            heapq.heappush(self._free_ports, port)
     
     def _is_port_available(self, port: int) -> bool:
         """Check if port is available"""
@@ -103,7 +199,8 @@ class MicroserviceDeployer:
     async def deploy_agent_service(
         self, 
         agent_id: str, 
-        config: Dict[str, Any] = None
+        config: Dict[str, Any] = None,
+        allow_multiple: bool = False
     ) -> Optional[ServiceDeployment]:
         """
         Deploy an agent as a microservice
@@ -111,6 +208,7 @@ class MicroserviceDeployer:
         Args:
             agent_id: Agent identifier to deploy
             config: Optional deployment configuration
+            allow_multiple: Deploy even if the agent already has a running instance
             
         Returns:
             Service deployment info or None if failed
@@ -124,16 +222,42 @@ class MicroserviceDeployer:
             return None
         
         # Check if already deployed
-        if any(d.agent_id == agent_id for d in self.deployments.values()):
+        if not allow_multiple and self._by_agent.get(agent_id):
             logger.warning(f"Agent {agent_id} already deployed")
             return None
         
-        # Allocate port
+        port = self._allocate_and_reserve_port(agent_id)
+        if not port:
+            return None
+        
+        return await self._deploy_with_port(agent_id, port, config)
+    
+    def _allocate_and_reserve_port(self, agent_id: str) -> Optional[int]:
+        """
+        Allocate a port and reserve it for a new service of the agent
+        
+        Runs without awaiting, so concurrent deploys on the event loop never share a port.
+        
+        Returns:
+            Reserved port or None if none are free
+        """
         port = self._find_available_port()
         if not port:
             logger.error("No available ports for deployment")
             return None
         
+        self.port_allocations[port] = f"{agent_id}-service-{int(time.time())}-{port}"
+        return port
+    
+    async def _deploy_with_port(
+        self, 
+        agent_id: str, 
+        port: int, 
+        config: Dict[str, Any] = None
+    ) -> Optional[ServiceDeployment]:
+        """Deploy an agent service on a port reserved by _allocate_and_reserve_port"""
+        service_id = self.port_allocations[port]
+        
         # Merge configurations
         deployment_config = self.default_config.copy()
         if agent_id in self.deployment_configs:
@@ -141,7 +265,6 @@ class MicroserviceDeployer:
         if config:
             deployment_config.update(config)
         
-        service_id = f"{agent_id}-service-{int(time.time())}"
         endpoint = f"http://localhost:{port}"
         health_check_url = f"{endpoint}/health"
         
@@ -163,17 +286,23 @@ class MicroserviceDeployer:
             process = await self._start_service_process(agent_id, port, deployment_config)
             if not process:
                 logger.error(f"Failed to start service process for {agent_id}")
+                self._release_port(port)
                 return None
             
             deployment.process_id = process.pid
             
+            # Keep the child's output pipes from filling up and blocking it
+            self._start_log_drains(service_id, process)
+            
             # Wait for service to be ready
-            if await self._wait_for_service_ready(health_check_url, timeout=30):
+            if await self._wait_for_service_ready(health_check_url, timeout=30, process=process):
                 deployment.status = "running"
                 
                 # Register deployment
                 self.deployments[service_id] = deployment
-                self.port_allocations[port] = service_id
+                self._dict_cache[service_id] = deployment.to_dict()
+                self._by_agent[agent_id].add(service_id)
+                self.processes[service_id] = process
                 
                 # Update agent registry with endpoint
                 await self._register_service_endpoint(agent_id, endpoint)
@@ -185,18 +314,15 @@ class MicroserviceDeployer:
                 logger.error(f"Service {service_id} failed to become ready")
                 
                 # Cleanup failed deployment
-                try:
-                    process.terminate()
-                    await asyncio.sleep(1)
-                    if process.poll() is None:
-                        process.kill()
-                except:
-                    pass
+                await self._stop_service_process(process, timeout=1.0)
                 
+                self._stop_log_drains(service_id)
+                self._release_port(port)
                 return None
                 
         except Exception as e:
             logger.error(f"Failed to deploy agent {agent_id}: {e}")
+            self._release_port(port)
             return None
     
     async def _start_service_process(
@@ -204,29 +330,26 @@ class MicroserviceDeployer:
         agent_id: str, 
         port: int, 
         config: Dict[str, Any]
-    ) -> Optional[subprocess.Popen]:
+    ) -> Optional[Any]:
         """Start the agent service process"""
         
-        # Create service script
-        service_script = self._generate_service_script(agent_id, port, config)
-        script_path = Path(f"temp/service_{agent_id}_{port}.py")
-        script_path.parent.mkdir(exist_ok=True)
-        
-        with open(script_path, 'w') as f:
-            f.write(service_script)
+        if self._mp_context is not None:
+            return self._fork_service_process(agent_id, port, config)
         
-        # Start process
+        # Service entrypoint reads everything it needs from the environment
         env = os.environ.copy()
         env['AGENT_ID'] = agent_id
         env['SERVICE_PORT'] = str(port)
+        env['SERVICE_CONFIG'] = json.dumps(config)
         
         try:
-            process = subprocess.Popen(
-                ['python', str(script_path)],
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, '-m', SERVICE_ENTRYPOINT,
                 env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                preexec_fn=os.setsid  # Create new process group
+                cwd=str(PROJECT_ROOT),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True  # Create new process group
             )
             
             logger.info(f"Started service process {process.pid} for agent {agent_id}")
@@ -236,93 +359,97 @@ class MicroserviceDeployer:
             logger.error(f"Failed to start service process: {e}")
             return None
     
-    def _generate_service_script(self, agent_id: str, port: int, config: Dict[str, Any]) -> str:
-        """Generate Python script for running agent service"""
-        return f"""#!/usr/bin/env python3
-\"\"\"
-Auto-generated service script for agent: {agent_id}
-Port: {port}
-Generated at: {datetime.utcnow().isoformat()}
-\"\"\"
-import os
-import sys
-import logging
-import asyncio
-from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from agents.agent_registry import get_registry
-from agents.agent_server import create_agent_app
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger('agent_service_{agent_id}')
-
-def main():
-    try:
-        # Get agent from registry
-        registry = get_registry()
-        
-        # Discover agents if not already done
-        registry.discover_agents()
-        
-        # Get agent instance
-        agent_instance = registry.get_agent_instance('{agent_id}')
-        if not agent_instance:
-            logger.error("Failed to create agent instance")
-            return 1
-        
-        # Create Flask app
-        app = create_agent_app(agent_instance)
-        
-        # Configure app
-        app.config.update({config})
-        
-        # Run service
-        logger.info(f"Starting agent service on port {port}")
-        app.run(
-            host='0.0.0.0',
-            port={port},
-            debug=False,
-            threaded=True
-        )
+    def _fork_service_process(
+        self, 
+        agent_id: str, 
+        port: int, 
+        config: Dict[str, Any]
+    ) -> Optional[ForkedServiceProcess]:
+        """Start the agent service as a child of the forkserver"""
+        from ._service_entrypoint import _run_agent_service
         
-    except KeyboardInterrupt:
-        logger.info("Service stopped by user")
-        return 0
-    except Exception as e:
-        logger.error(f"Service failed: {{e}}")
-        return 1
-
-if __name__ == '__main__':
-    exit_code = main()
-    sys.exit(exit_code)
-"""
+        try:
+            process = self._mp_context.Process(
+                target=_run_agent_service,
+                args=(agent_id, port, config),
+                name=f"agent-service-{agent_id}-{port}"
+            )
+            process.start()
+            
+            logger.info(f"Forked service process {process.pid} for agent {agent_id}")
+            return ForkedServiceProcess(process)
+            
+        except Exception as e:
+            logger.error(f"Failed to fork service process: {e}")
+            return None
     
-    async def _wait_for_service_ready(self, health_url: str, timeout: int = 30) -> bool:
-        """Wait for service to be ready"""
-        import httpx
-        
-        end_time = time.time() + timeout
-        
-        while time.time() < end_time:
+    def _start_log_drains(self, service_id: str, process):
+        """Forward a service's stdout/stderr to the deployer log"""
+        drains = []
+        for stream, level in (
+            (getattr(process, 'stdout', None), logging.INFO),
+            (getattr(process, 'stderr', None), logging.WARNING)
+        ):
+            if stream is not None:
+                drains.append(asyncio.create_task(self._drain(stream, service_id, level)))
+        if drains:
+            self._log_drains[service_id] = drains
+    
+    def _stop_log_drains(self, service_id: str):
+        """Cancel output readers for a service"""
+        for task in self._log_drains.pop(service_id, []):
+            task.cancel()
+    
+    async def _drain(self, stream: asyncio.StreamReader, service_id: str, level: int):
+        """Read a service output stream line by line until EOF"""
+        try:
+            async for line in stream:
+                logger.log(level, "[%s] %s", service_id, line.decode(errors='replace').rstrip())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Stopped reading output of {service_id}: {e}")
+    
+    def _client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=10,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.max_services,
+                    max_connections=self.max_services * 2
+                )
+            )
+        return self._http
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    async def _wait_for_service_ready(self, health_url: str, timeout: int = 30, process=None) -> bool:
+        """Wait for service to be ready, polling with exponential backoff"""
+        client = self._client()
+        end_time = time.monotonic() + timeout
+        delay = READY_POLL_INITIAL_DELAY
+        
+        while time.monotonic() < end_time:
+            # Give up early if the service process already exited
+            if process is not None and process.returncode is not None:
+                return False
+            
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(health_url, timeout=5)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('status') == 'ok':
-                            return True
+                response = await client.get(health_url)
+                if response.status_code == 200:
+                    data = response.json()
+                    if data.get('status') == 'ok':
+                        return True
             except:
                 pass
             
-            await asyncio.sleep(2)
+            await asyncio.sleep(min(delay, max(0.0, end_time - time.monotonic())))
+            delay = min(delay * 2, READY_POLL_MAX_DELAY)
         
         return False
     
@@ -358,28 +485,25 @@ if __name__ == '__main__':
         
         try:
             # Stop the process
-            if deployment.process_id:
+            process = self.processes.pop(service_id, None)
+            if process:
+                await self._stop_service_process(process, timeout=5.0)
+            elif deployment.process_id:
                 try:
-                    # Send SIGTERM to process group
+                    # No process handle tracked - signal the process group directly
                     os.killpg(os.getpgid(deployment.process_id), signal.SIGTERM)
-                    
-                    # Wait for graceful shutdown
-                    await asyncio.sleep(5)
-                    
-                    # Force kill if still running
-                    try:
-                        os.killpg(os.getpgid(deployment.process_id), signal.SIGKILL)
-                    except:
-                        pass
-                        
                 except ProcessLookupError:
                     pass  # Process already terminated
             
             # Cleanup
-            if deployment.port in self.port_allocations:
-                del self.port_allocations[deployment.port]
+            self._stop_log_drains(service_id)
+            self._release_port(deployment.port)
             
             del self.deployments[service_id]
+            self._dict_cache.pop(service_id, None)
+            self._by_agent[deployment.agent_id].discard(service_id)
+            if not self._by_agent[deployment.agent_id]:
+                del self._by_agent[deployment.agent_id]
             
             # Remove endpoint from registry
             await self._unregister_service_endpoint(deployment.agent_id)
@@ -391,6 +515,34 @@ if __name__ == '__main__':
             logger.error(f"Failed to undeploy service {service_id}: {e}")
             return False
     
+    async def _stop_service_process(self, process, timeout: float):
+        """Terminate a service's process group, escalating to SIGKILL after timeout"""
+        try:
+            self._signal_service_group(process, signal.SIGTERM)
+            
+            # Wait for graceful shutdown
+            try:
+                await asyncio.wait_for(process.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # Force kill if still running
+                self._signal_service_group(process, signal.SIGKILL)
+                await process.wait()
+                
+        except ProcessLookupError:
+            pass  # Process already terminated
+    
+    def _signal_service_group(self, process, sig: int):
+        """Send a signal to the process group a service runs in"""
+        pgid = os.getpgid(process.pid)
+        if pgid == os.getpgrp():
+            # Child has not detached into its own session yet - never signal our own group
+            if sig == signal.SIGKILL:
+                process.kill()
+            else:
+                process.terminate()
+        else:
+            os.killpg(pgid, sig)
+    
     async def _unregister_service_endpoint(self, agent_id: str):
         """Remove service endpoint from agent configuration"""
         try:
@@ -407,25 +559,22 @@ if __name__ == '__main__':
         if not deployment:
             return {"status": "not_found"}
         
-        import httpx
-        
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(deployment.health_check_url, timeout=10)
-                if response.status_code == 200:
-                    return {
-                        "status": "healthy",
-                        "service_id": service_id,
-                        "endpoint": deployment.endpoint,
-                        "response": response.json()
-                    }
-                else:
-                    return {
-                        "status": "unhealthy",
-                        "service_id": service_id,
-                        "endpoint": deployment.endpoint,
-                        "error": f"HTTP {response.status_code}"
-                    }
+            response = await self._client().get(deployment.health_check_url)
+            if response.status_code == 200:
+                return {
+                    "status": "healthy",
+                    "service_id": service_id,
+                    "endpoint": deployment.endpoint,
+                    "response": response.json()
+                }
+            else:
+                return {
+                    "status": "unhealthy",
+                    "service_id": service_id,
+                    "endpoint": deployment.endpoint,
+                    "error": f"HTTP {response.status_code}"
+                }
         except Exception as e:
             return {
                 "status": "unreachable",
@@ -436,34 +585,34 @@ if __name__ == '__main__':
     
     async def health_check_all_services(self) -> Dict[str, Dict[str, Any]]:
         """Health check all deployed services"""
-        results = {}
+        service_ids = list(self.deployments.keys())
         
-        tasks = [
-            (service_id, self.health_check_service(service_id))
-            for service_id in self.deployments.keys()
-        ]
+        # Probe all services concurrently over the shared client
+        responses = await asyncio.gather(
+            *[self.health_check_service(service_id) for service_id in service_ids],
+            return_exceptions=True
+        )
         
-        for service_id, task in tasks:
-            try:
-                result = await task
-                results[service_id] = result
-            except Exception as e:
+        results = {}
+        for service_id, result in zip(service_ids, responses):
+            if isinstance(result, Exception):
                 results[service_id] = {
                     "status": "error",
                     "service_id": service_id,
-                    "error": str(e)
+                    "error": str(result)
                 }
+            else:
+                results[service_id] = result
         
         return results
     
     def list_deployments(self) -> List[Dict[str, Any]]:
         """List all current deployments"""
-        return [deployment.to_dict() for deployment in self.deployments.values()]
+        return list(self._dict_cache.values())
     
     def get_deployment(self, service_id: str) -> Optional[Dict[str, Any]]:
         """Get specific deployment info"""
-        deployment = self.deployments.get(service_id)
-        return deployment.to_dict() if deployment else None
+        return self._dict_cache.get(service_id)
     
     async def scale_agent_services(self, agent_id: str, target_instances: int) -> List[str]:
         """
@@ -476,32 +625,52 @@ if __name__ == '__main__':
         Returns:
             List of service IDs for the agent
         """
-        # Find current instances
-        current_services = [
-            d for d in self.deployments.values() 
-            if d.agent_id == agent_id
-        ]
+        # Find current instances (oldest first, so scale-down removes the newest)
+        current_services = sorted(
+            self._services_for_agent(agent_id),
+            key=lambda d: d.deployed_at
+        )
         current_count = len(current_services)
         
         logger.info(f"Scaling {agent_id}: {current_count} -> {target_instances}")
         
         service_ids = [s.service_id for s in current_services]
         
-        if target_instances > current_count:
-            # Scale up
+        if target_instances > current_count and not self.registry.get_agent_class(agent_id):
+            logger.error(f"Agent {agent_id} not found in registry")
+        elif target_instances > current_count:
+            # Scale up - reserve all ports first, then deploy new instances concurrently
+            ports = []
             for _ in range(target_instances - current_count):
-                deployment = await self.deploy_agent_service(agent_id)
-                if deployment:
+                port = self._allocate_and_reserve_port(agent_id)
+                if not port:
+                    break
+                ports.append(port)
+            
+            deployments = await asyncio.gather(
+                *[self._deploy_with_port(agent_id, port) for port in ports],
+                return_exceptions=True
+            )
+            for deployment in deployments:
+                if isinstance(deployment, ServiceDeployment):
                     service_ids.append(deployment.service_id)
         elif target_instances < current_count:
-            # Scale down
+            # Scale down - stop surplus instances concurrently
             services_to_remove = current_services[target_instances:]
-            for service in services_to_remove:
-                await self.undeploy_service(service.service_id)
-                service_ids.remove(service.service_id)
+            removed = await asyncio.gather(
+                *[self.undeploy_service(service.service_id) for service in services_to_remove],
+                return_exceptions=True
+            )
+            for service, result in zip(services_to_remove, removed):
+                if result is True:
+                    service_ids.remove(service.service_id)
         
         return service_ids
     
+    def _services_for_agent(self, agent_id: str) -> List[ServiceDeployment]:
+        """Get deployments of an agent via the per-agent index"""
+        return [self.deployments[service_id] for service_id in self._by_agent.get(agent_id, ())]
+    
     async def auto_scale_based_on_load(self):
         """Automatically scale services based on load metrics"""
         # This would implement auto-scaling logic based on:
@@ -510,70 +679,103 @@ if __name__ == '__main__':
         # - Response times
         # - Error rates
         
-        for agent_id in set(d.agent_id for d in self.deployments.values()):
+        # Probe every service once up front, then decide per agent from the rollups
+        metrics = await self._collect_all_metrics()
+        
+        for agent_id in list(self._by_agent):
             # Get load metrics for agent
-            load_metrics = await self._get_agent_load_metrics(agent_id)
+            load_metrics = self._get_agent_load_metrics(agent_id, metrics)
             
             # Determine if scaling is needed
             if load_metrics.get('avg_cpu_percent', 0) > 80:
                 # Scale up
-                current_instances = len([d for d in self.deployments.values() if d.agent_id == agent_id])
+                current_instances = len(self._by_agent.get(agent_id, ()))
                 await self.scale_agent_services(agent_id, current_instances + 1)
             elif load_metrics.get('avg_cpu_percent', 0) < 20:
                 # Scale down (but keep at least 1 instance)
-                current_instances = len([d for d in self.deployments.values() if d.agent_id == agent_id])
+                current_instances = len(self._by_agent.get(agent_id, ()))
                 if current_instances > 1:
                     await self.scale_agent_services(agent_id, current_instances - 1)
     
-    async def _get_agent_load_metrics(self, agent_id: str) -> Dict[str, float]:
-        """Get load metrics for an agent's services"""
-        services = [d for d in self.deployments.values() if d.agent_id == agent_id]
+    async def _collect_all_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Collect load metrics from all services concurrently, keyed by service_id"""
+        service_ids = list(self.deployments.keys())
+        results = await asyncio.gather(
+            *[self._probe_metrics(self.deployments[service_id]) for service_id in service_ids],
+            return_exceptions=True
+        )
+        return {
+            service_id: result
+            for service_id, result in zip(service_ids, results)
+            if isinstance(result, dict)
+        }
+    
+    async def _probe_metrics(self, deployment: ServiceDeployment) -> Dict[str, float]:
+        """Get load metrics for a single service"""
+        # This would query the service over the shared client (self._client())
+        # For now, return dummy metrics
+        return {
+            'cpu_percent': 50.0,
+            'memory_percent': 60.0,
+            'response_time': 200.0,
+            'requests': 1000,
+            'error_rate': 0.1
+        }
+    
+    def _get_agent_load_metrics(self, agent_id: str, metrics: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+        """Roll up collected service metrics for an agent's services"""
+        samples = [metrics[s] for s in self._by_agent.get(agent_id, ()) if s in metrics]
         
-        if not services:
+        if not samples:
             return {}
         
-        # This would collect actual metrics from the services
-        # For now, return dummy metrics
+        count = len(samples)
         return {
-            'avg_cpu_percent': 50.0,
-            'avg_memory_percent': 60.0,
-            'avg_response_time': 200.0,
-            'total_requests': 1000,
-            'error_rate': 0.1
+            'avg_cpu_percent': sum(m['cpu_percent'] for m in samples) / count,
+            'avg_memory_percent': sum(m['memory_percent'] for m in samples) / count,
+            'avg_response_time': sum(m['response_time'] for m in samples) / count,
+            'total_requests': sum(m['requests'] for m in samples),
+            'error_rate': sum(m['error_rate'] for m in samples) / count
         }
     
     def generate_docker_compose(self, output_file: str = "docker-compose.yml"):
         """Generate Docker Compose configuration for all services"""
-        services = {}
-        
-        for deployment in self.deployments.values():
-            service_name = f"agent-{deployment.agent_id}"
-            services[service_name] = {
-                'build': {
-                    'context': '.',
-                    'dockerfile': f'Dockerfile.agent.{deployment.agent_id}'
-                },
-                'ports': [f"{deployment.port}:{deployment.port}"],
-                'environment': {
-                    'AGENT_ID': deployment.agent_id,
-                    'SERVICE_PORT': deployment.port
-                },
-                'restart': 'unless-stopped',
-                'healthcheck': {
-                    'test': f"curl -f {deployment.health_check_url} || exit 1",
-                    'interval': '30s',
-                    'timeout': '10s',
-                    'retries': 3
-                }
-            }
-        
-        compose_config = {
-            'version': '3.8',
-            'services': services
-        }
+        written = set()
         
+        # Stream one service entry at a time instead of dumping one big document
         with open(output_file, 'w') as f:
-            yaml.dump(compose_config, f, default_flow_style=False)
+            yaml.dump({'version': '3.8'}, f, Dumper=SafeDumper, default_flow_style=False)
+            f.write("services:")
+            
+            for deployment in self.deployments.values():
+                service_name = f"agent-{deployment.agent_id}"
+                if service_name in written:
+                    continue  # One compose service per agent
+                written.add(service_name)
+                
+                service_spec = {
+                    'build': {
+                        'context': '.',
+                        'dockerfile': f'Dockerfile.agent.{deployment.agent_id}'
+                    },
+                    'ports': [f"{deployment.port}:{deployment.port}"],
+                    'environment': {
+                        'AGENT_ID': deployment.agent_id,
+                        'SERVICE_PORT': deployment.port
+                    },
+                    'restart': 'unless-stopped',
+                    'healthcheck': {
+                        'test': ['CMD', 'python', '-c', HEALTHCHECK_SCRIPT.format(url=deployment.health_check_url)],
+                        'interval': '30s',
+                        'timeout': '10s',
+                        'retries': 3
+                    }
+                }
+                
+                entry = yaml.dump({service_name: service_spec}, Dumper=SafeDumper, default_flow_style=False)
+                f.write("\n" + "".join(f"  {line}" for line in entry.rstrip("\n").splitlines(keepends=True)))
+            
+            f.write("\n" if written else " {}\n")
         
         logger.info(f"Generated Docker Compose configuration: {output_file}")
 
@@ -588,19 +790,20 @@ def get_deployer() -> MicroserviceDeployer:
     return _global_deployer
 
 # Convenience functions
-async def deploy_agent(agent_id: str, config: Dict[str, Any] = None) -> Optional[str]:
+async def deploy_agent(agent_id: str, config: Dict[str, Any] = None, allow_multiple: bool = False) -> Optional[str]:
     """
     Deploy agent as microservice
     
     Args:
         agent_id: Agent to deploy
         config: Optional deployment config
+        allow_multiple: Deploy even if the agent already has a running instance
         
     Returns:
         Service ID if successful
     """
     deployer = get_deployer()
-    deployment = await deployer.deploy_agent_service(agent_id, config)
+    deployment = await deployer.deploy_agent_service(agent_id, config, allow_multiple=allow_multiple)
     return deployment.service_id if deployment else None
 
 async def undeploy_agent(service_id: str) -> bool:
@@ -5,9 +5,16 @@ This module handles automatic team formation based on job requirements
 and orchestrates multi-agent collaboration for complex tasks.
 """
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Any, Optional, Set, Tuple
-from dataclasses import dataclass, asdict
+import re
+import sys
+import time
+from collections import ChainMap, Counter
+from collections.abc import Mapping
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterator, List, Any, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 import uuid
 import json
@@ -17,25 +24,33 @@ from .base_agent import BaseAgent, AgentResponse, AgentStatus
 
 logger = logging.getLogger('juniorgpt.team_orchestrator')
 
-@dataclass
+# Capability fields matched against job requirements
+CAPABILITY_FIELDS = ('specializations', 'supported_domains', 'input_types', 'output_formats')
+CAPABILITY_SEPARATOR = "\x1f"
+
+# __slots__ for per-job dataclasses where supported (dataclass slots needs Python 3.10)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Queue order for JobRequirement.priority (lower runs first)
+PRIORITY_RANK = {"critical": 0, "high": 1, "normal": 2, "low": 3}
+
+# Description keywords for coordination strategy selection (substring, case-insensitive)
+COLLABORATIVE_KEYWORDS = re.compile(r"analysis|research", re.IGNORECASE)
+URGENT_KEYWORDS = re.compile(r"urgent", re.IGNORECASE)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class JobRequirement:
     """Defines requirements for a job or task"""
     job_id: str
     description: str
     required_capabilities: List[str]
-    preferred_capabilities: List[str] = None
+    preferred_capabilities: List[str] = field(default_factory=list)
     max_agents: int = 5
     timeout: int = 300
     priority: str = "normal"  # low, normal, high, critical
-    context: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.preferred_capabilities is None:
-            self.preferred_capabilities = []
-        if self.context is None:
-            self.context = {}
+    context: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TeamConfiguration:
     """Configuration for a dynamically formed team"""
     team_id: str
@@ -46,11 +61,17 @@ class TeamConfiguration:
     formed_at: datetime
     
     def to_dict(self) -> Dict[str, Any]:
-        result = asdict(self)
-        result['formed_at'] = self.formed_at.isoformat()
-        return result
+        # Built by hand: asdict would deep-copy agents and roles on every status poll
+        return {
+            "team_id": self.team_id,
+            "job_id": self.job_id,
+            "agents": self.agents,
+            "roles": self.roles,
+            "coordination_strategy": self.coordination_strategy,
+            "formed_at": self.formed_at.isoformat()
+        }
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class JobExecution:
     """Tracks execution of a job by a team"""
     execution_id: str
@@ -61,10 +82,54 @@ class JobExecution:
     completed_at: Optional[datetime] = None
     results: Dict[str, Any] = None
     error_message: str = ""
+    # Serialized status for get_execution_status, dropped whenever a field changes
+    _cached_status: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.results is None:
             self.results = {}
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name != '_cached_status':
+            object.__setattr__(self, '_cached_status', None)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        result = {
+            "execution_id": self.execution_id,
+            "job_id": self.job_id,
+            "team_id": self.team_id,
+            "status": self.status,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "error_message": self.error_message
+        }
+        
+        if self.results:
+            result["results"] = self.results
+        
+        return result
+
+class _PeerResponsesView(Mapping):
+    """Read-only agent_id -> content view over completed first-round results"""
+    
+    def __init__(self, results: Dict[str, Any]):
+        self._results = results
+    
+    def _completed(self, result: Dict[str, Any]) -> bool:
+        return 'response' in result and result['response'].get('status') == 'completed'
+    
+    def __getitem__(self, agent_id: str) -> str:
+        result = self._results[agent_id]
+        if not self._completed(result):
+            raise KeyError(agent_id)
+        return result['response'].get('content', '')
+    
+    def __iter__(self) -> Iterator[str]:
+        return (agent_id for agent_id, result in self._results.items() if self._completed(result))
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
 
 class TeamOrchestrator:
     """
@@ -81,14 +146,47 @@ class TeamOrchestrator:
     def __init__(self):
         self.registry = get_registry()
         self.active_teams: Dict[str, TeamConfiguration] = {}
-        self.job_queue: List[JobRequirement] = []
+        # Heap of (priority rank, submit time, sequence, job, team, execution)
+        self.job_queue: List[Tuple[int, float, int, JobRequirement, 'TeamConfiguration', 'JobExecution']] = []
+        self._queue_sequence = itertools.count()
         self.running_executions: Dict[str, JobExecution] = {}
-        self.agent_workloads: Dict[str, int] = {}  # agent_id -> active job count
+        self.agent_workloads: Counter = Counter()  # agent_id -> active job count (idle agents absent)
+        self.agent_capacity: Dict[str, int] = {}  # agent_id -> max concurrent jobs (default max_jobs_per_agent)
+        # Assignments of queued jobs, counted as load so burst submissions spread across agents
+        self._reserved_load: Counter = Counter()  # agent_id -> queued job count
+        self._reservations: Dict[str, List[str]] = {}  # execution_id -> reserved agent_ids
+        # Set (and dropped) whenever an agent frees a job slot; created in the running loop on first wait
+        self._slot_freed: Optional[asyncio.Event] = None
+        self._slot_freed_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._capability_cache: Dict[str, Dict[str, Any]] = {}  # agent_id -> scoring data
+        # agent_id -> live instance, valid while registry.instance_version is unchanged
+        self._instance_cache: Dict[str, BaseAgent] = {}
+        self._instance_cache_version = self.registry.instance_version
+        # Inverted capability index: requirement -> agents matching it, for the current registry
+        self._requirement_matches: Dict[str, FrozenSet[str]] = {}
+        self._requirement_matches_agents: FrozenSet[str] = frozenset()
+        
+        # Agent health, refreshed by a periodic background sweep
+        self._healthy: Set[str] = set()
+        self._health_checked: Set[str] = set()
+        self._health_sweep_task: Optional[asyncio.Task] = None
+        
+        # Finished teams awaiting removal from active_teams
+        self._completed_teams: Set[str] = set()
+        self._team_sweep_task: Optional[asyncio.Task] = None
         
         # Configuration
         self.max_concurrent_jobs = 10
+        self.max_jobs_per_agent = 3
+        self.health_sweep_interval = 30  # seconds
+        self.team_sweep_interval = 10  # seconds
+        self.idle_wait_timeout = 5  # seconds a queued job waits for an overloaded agent to free up
         self.default_coordination_strategy = "parallel"
         
+        # Admission control: at most max_concurrent_jobs executions run at once; created in the running loop
+        self._exec_sem: Optional[asyncio.Semaphore] = None
+        self._exec_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+        
     async def submit_job(self, job: JobRequirement) -> str:
         """
         Submit a job for execution
@@ -116,12 +214,121 @@ class TeamOrchestrator:
         
         self.running_executions[execution.execution_id] = execution
         self.active_teams[team.team_id] = team
+        self._reserve_agents(execution.execution_id, team.agents)
         
-        # Execute job with team
-        asyncio.create_task(self._execute_job_with_team(job, team, execution))
+        # Queue job by priority; each submission schedules one run of the queue head
+        heapq.heappush(self.job_queue, (
+            PRIORITY_RANK.get(job.priority, PRIORITY_RANK["normal"]),
+            time.monotonic(),
+            next(self._queue_sequence),
+            job, team, execution
+        ))
+        asyncio.create_task(self._run_next_queued_job())
         
         return execution.execution_id
     
+    async def _run_next_queued_job(self):
+        """Wait for an execution slot, then pop the highest-priority queued job and execute it"""
+        async with self._execution_semaphore():
+            if not self.job_queue:
+                return
+            
+            _, _, _, job, team, execution = heapq.heappop(self.job_queue)
+            await self._run_queued_job(job, team, execution)
+    
+    def _execution_semaphore(self) -> asyncio.Semaphore:
+        """Get the admission-control semaphore, bound to the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._exec_sem is None or self._exec_sem_loop is not loop:
+            self._exec_sem = asyncio.Semaphore(self.max_concurrent_jobs)
+            self._exec_sem_loop = loop
+        return self._exec_sem
+    
+    async def _run_queued_job(self, job: JobRequirement, team: TeamConfiguration, execution: JobExecution):
+        """Execute a dequeued job, rebalancing its team first"""
+        # Reservation ends here: the team is rechecked against current load, then charged as running
+        self._unreserve_agents(execution.execution_id)
+        if execution.status == "cancelled":
+            self._retire_team(team)
+            return
+        
+        # Team was scored at submit time; swap out members that have since filled up
+        if not await self._steal_idle_agents(job, team):
+            slot_freed = self._slot_freed_event()
+            try:
+                await asyncio.wait_for(slot_freed.wait(), timeout=self.idle_wait_timeout)
+            except asyncio.TimeoutError:
+                pass
+            await self._steal_idle_agents(job, team)
+        
+        if execution.status == "cancelled":
+            self._retire_team(team)
+            return
+        
+        await self._execute_job_with_team(job, team, execution)
+    
+    async def _steal_idle_agents(self, job: JobRequirement, team: TeamConfiguration) -> bool:
+        """
+        Replace overloaded team members with idle agents that can handle the job
+        
+        Returns:
+            True if no team member is left overloaded
+        """
+        overloaded = [agent_id for agent_id in team.agents if self._normalized_load(agent_id) >= 1.0]
+        if not overloaded:
+            return True
+        
+        idle_agents = [
+            agent_id for agent_id in self.registry.agents
+            if agent_id not in team.agents
+            and self._normalized_load(agent_id) == 0
+            and self._is_agent_available(agent_id)
+        ]
+        if not idle_agents:
+            return False
+        
+        score_agent = self._make_job_scorer(job, idle_agents)
+        scores = await asyncio.gather(
+            *[score_agent(agent_id) for agent_id in idle_agents],
+            return_exceptions=True
+        )
+        candidates = heapq.nlargest(
+            len(overloaded),
+            (
+                (agent_id, score) for agent_id, score in zip(idle_agents, scores)
+                if not isinstance(score, BaseException) and score > 0
+            ),
+            key=lambda x: x[1]
+        )
+        
+        for busy_id, (idle_id, _) in zip(overloaded, candidates):
+            team.agents[team.agents.index(busy_id)] = idle_id
+            team.roles[idle_id] = team.roles.pop(busy_id, "support")
+            logger.info(f"Team {team.team_id}: replaced overloaded agent {busy_id} with idle agent {idle_id}")
+        
+        return len(candidates) == len(overloaded)
+    
+    def _normalized_load(self, agent_id: str) -> float:
+        """Running plus queued assignments as a fraction of agent capacity (1.0 means full)"""
+        capacity = self.agent_capacity.get(agent_id, self.max_jobs_per_agent)
+        if capacity <= 0:
+            return 1.0
+        return (self.agent_workloads[agent_id] + self._reserved_load[agent_id]) / capacity
+    
+    def _reserve_agents(self, execution_id: str, agent_ids: List[str]):
+        """Count a queued job against its team's load until it starts"""
+        self._reservations[execution_id] = list(agent_ids)
+        self._reserved_load.update(agent_ids)
+    
+    def _unreserve_agents(self, execution_id: str):
+        """Drop a queued job's reservation (no-op if already dropped)"""
+        reserved = self._reserved_load
+        for agent_id in self._reservations.pop(execution_id, ()):
+            if reserved[agent_id] > 1:
+                reserved[agent_id] -= 1
+            else:
+                reserved.pop(agent_id, None)
+    
     async def _form_team_for_job(self, job: JobRequirement) -> Optional[TeamConfiguration]:
         """
         Form optimal team based on job requirements
@@ -133,6 +340,7 @@ class TeamOrchestrator:
             Team configuration or None if team cannot be formed
         """
         logger.info(f"Forming team for job: {job.job_id}")
+        self._ensure_health_sweep()
         
         # Get all available agents
         available_agents = []
@@ -144,20 +352,25 @@ class TeamOrchestrator:
             logger.warning("No available agents for team formation")
             return None
         
-        # Score agents for this job
-        agent_scores = {}
-        for agent_id in available_agents:
-            score = await self._score_agent_for_job(agent_id, job)
-            if score > 0:
-                agent_scores[agent_id] = score
+        # Score agents for this job concurrently; a failed score counts as 0.0
+        score_agent = self._make_job_scorer(job, available_agents)
+        scores = await asyncio.gather(
+            *[score_agent(agent_id) for agent_id in available_agents],
+            return_exceptions=True
+        )
+        agent_scores = {
+            agent_id: score
+            for agent_id, score in zip(available_agents, scores)
+            if not isinstance(score, BaseException) and score > 0
+        }
         
         if not agent_scores:
             logger.warning(f"No suitable agents found for job {job.job_id}")
             return None
         
         # Select best agents
-        sorted_agents = sorted(agent_scores.items(), key=lambda x: x[1], reverse=True)
-        selected_agents = [agent_id for agent_id, _ in sorted_agents[:job.max_agents]]
+        top_agents = heapq.nlargest(job.max_agents, agent_scores.items(), key=lambda x: x[1])
+        selected_agents = [agent_id for agent_id, _ in top_agents]
         
         # Assign roles based on capabilities
         roles = self._assign_roles(selected_agents, job)
@@ -180,23 +393,64 @@ class TeamOrchestrator:
     def _is_agent_available(self, agent_id: str) -> bool:
         """Check if agent is available for assignment"""
         # Check current workload
-        current_workload = self.agent_workloads.get(agent_id, 0)
-        max_concurrent = 3  # Configurable per agent
-        
-        if current_workload >= max_concurrent:
+        if self._normalized_load(agent_id) >= 1.0:
             return False
         
-        # Check agent health
+        # Check agent health (agents not yet seen by the sweep are checked once inline)
+        if agent_id not in self._health_checked:
+            self._refresh_agent_health(agent_id)
+        
+        return agent_id in self._healthy
+    
+    def _refresh_agent_health(self, agent_id: str):
+        """Run an agent's health check and record the result"""
+        healthy = True
         try:
-            agent_instance = self.registry.get_agent_instance(agent_id)
+            agent_instance = self._get_agent_instance(agent_id)
             if agent_instance:
                 health = agent_instance.health_check()
-                return health.get('healthy', False)
+                healthy = health.get('healthy', False)
         except Exception as e:
             logger.warning(f"Health check failed for agent {agent_id}: {e}")
-            return False
+            healthy = False
         
-        return True
+        self._health_checked.add(agent_id)
+        if healthy:
+            self._healthy.add(agent_id)
+        else:
+            self._healthy.discard(agent_id)
+    
+    def _get_agent_instance(self, agent_id: str) -> Optional[BaseAgent]:
+        """Get an agent instance, memoized until the registry stops or re-registers an agent"""
+        if self._instance_cache_version != self.registry.instance_version:
+            self._instance_cache.clear()
+            self._instance_cache_version = self.registry.instance_version
+        
+        instance = self._instance_cache.get(agent_id)
+        if instance is None:
+            instance = self.registry.get_agent_instance(agent_id)
+            if instance is not None:
+                self._instance_cache[agent_id] = instance
+        
+        return instance
+    
+    def _ensure_health_sweep(self):
+        """Start the background health sweep if it is not running"""
+        if self._health_sweep_task is None or self._health_sweep_task.done():
+            self._health_sweep_task = asyncio.create_task(self._health_sweep_loop())
+    
+    async def _health_sweep_loop(self):
+        """Periodically refresh health of all registered agents"""
+        while True:
+            registered = set(self.registry.agents.keys())
+            for agent_id in registered:
+                self._refresh_agent_health(agent_id)
+            
+            # Forget agents that were unregistered since the last sweep
+            self._health_checked &= registered
+            self._healthy &= registered
+            
+            await asyncio.sleep(self.health_sweep_interval)
     
     async def _score_agent_for_job(self, agent_id: str, job: JobRequirement) -> float:
         """
@@ -209,73 +463,139 @@ class TeamOrchestrator:
         Returns:
             Suitability score (0.0 to 1.0)
         """
-        try:
-            agent_class = self.registry.get_agent_class(agent_id)
-            if not agent_class:
-                return 0.0
-            
-            # Create temporary instance for capability check
-            temp_instance = agent_class()
-            capabilities = temp_instance.get_capabilities()
-            
-            # Calculate capability match score
-            capability_score = 0.0
-            total_requirements = len(job.required_capabilities) + len(job.preferred_capabilities)
-            
-            if total_requirements == 0:
-                capability_score = 0.5  # Neutral score for jobs with no specific requirements
-            else:
-                # Check required capabilities
-                for required in job.required_capabilities:
-                    if self._has_capability(capabilities, required):
-                        capability_score += 1.0 / total_requirements
-                
-                # Check preferred capabilities (weighted less)
-                for preferred in job.preferred_capabilities:
-                    if self._has_capability(capabilities, preferred):
-                        capability_score += 0.5 / total_requirements
-            
-            # Check direct message handling capability
-            message_score = temp_instance.can_handle(job.description, job.context)
-            
-            # Combine scores
-            final_score = (capability_score * 0.6) + (message_score * 0.4)
-            
-            # Apply load balancing penalty
-            current_load = self.agent_workloads.get(agent_id, 0)
-            load_penalty = min(0.3, current_load * 0.1)
-            final_score = max(0.0, final_score - load_penalty)
-            
-            return final_score
-            
-        except Exception as e:
-            logger.warning(f"Failed to score agent {agent_id}: {e}")
-            return 0.0
+        return await self._make_job_scorer(job, [agent_id])(agent_id)
     
-    def _has_capability(self, capabilities: Dict[str, Any], required: str) -> bool:
-        """Check if agent capabilities match requirement"""
-        required_lower = required.lower()
+    def _make_job_scorer(self, job: JobRequirement, agent_ids: List[str]) -> Callable[[str], Awaitable[float]]:
+        """
+        Build a scorer specialized to one job
         
-        # Check specializations
-        specializations = capabilities.get('specializations', [])
-        if any(required_lower in spec.lower() for spec in specializations):
-            return True
+        The job does not change while a team is formed, so capability matches
+        for all candidates, the description and the context are bound once
+        here instead of being re-read for every agent.
         
-        # Check supported domains
-        domains = capabilities.get('supported_domains', [])
-        if any(required_lower in domain.lower() for domain in domains):
-            return True
+        Args:
+            job: Job requirements
+            agent_ids: Candidates the scorer will be called with
+            
+        Returns:
+            Coroutine function mapping agent_id to a score (0.0 to 1.0)
+        """
+        capability_scores = self._capability_scores(agent_ids, job)
+        description = job.description
+        context = job.context
+        get_capabilities = self._get_cached_capabilities
+        normalized_load = self._normalized_load
+        
+        async def score(agent_id: str) -> float:
+            try:
+                capabilities = get_capabilities(agent_id)
+                if not capabilities:
+                    return 0.0
+                
+                # Check direct message handling capability
+                message_score = capabilities['instance'].can_handle(description, context)
+                
+                # Combine scores
+                final_score = (capability_scores[agent_id] * 0.6) + (message_score * 0.4)
+                
+                # Scale by free capacity so busy agents lose in proportion to their load
+                return final_score * max(0.0, 1.0 - normalized_load(agent_id))
+                
+            except Exception as e:
+                logger.warning(f"Failed to score agent {agent_id}: {e}")
+                return 0.0
         
-        # Check input/output types
-        input_types = capabilities.get('input_types', [])
-        output_formats = capabilities.get('output_formats', [])
+        return score
+    
+    def _capability_scores(self, agent_ids: List[str], job: JobRequirement) -> Dict[str, float]:
+        """
+        Capability match scores for several agents at once
         
-        if any(required_lower in itype.lower() for itype in input_types):
-            return True
-        if any(required_lower in oformat.lower() for oformat in output_formats):
-            return True
+        Each requirement adds its weight to the agents in its inverted-index
+        entry, so the cost follows the number of matches instead of
+        agents x requirements.
+        """
+        total_requirements = len(job.required_capabilities) + len(job.preferred_capabilities)
+        if total_requirements == 0:
+            # Neutral score for jobs with no specific requirements
+            return dict.fromkeys(agent_ids, 0.5)
+        
+        scores = dict.fromkeys(agent_ids, 0.0)
+        required_weight = 1.0 / total_requirements
+        preferred_weight = 0.5 / total_requirements
+        
+        for requirements, weight in ((job.required_capabilities, required_weight),
+                                     (job.preferred_capabilities, preferred_weight)):
+            for requirement in requirements:
+                for agent_id in self._agents_matching(requirement):
+                    if agent_id in scores:
+                        scores[agent_id] += weight
+        
+        return scores
+    
+    def _agents_matching(self, requirement: str) -> FrozenSet[str]:
+        """Registered agents whose capabilities match a requirement (memoized)"""
+        registered = frozenset(self.registry.agents)
+        if registered != self._requirement_matches_agents:
+            self._requirement_matches.clear()
+            self._requirement_matches_agents = registered
+        
+        matches = self._requirement_matches.get(requirement)
+        if matches is None:
+            required_lower = requirement.lower()
+            matching = []
+            for agent_id in registered:
+                capabilities = self._get_cached_capabilities(agent_id)
+                if capabilities and self._has_capability(capabilities, required_lower):
+                    matching.append(agent_id)
+            matches = self._requirement_matches[requirement] = frozenset(matching)
+        
+        return matches
+    
+    def _get_cached_capabilities(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get scoring data for an agent, building it once per agent class
         
-        return False
+        Returns:
+            Dict with the probe instance, raw capabilities and lowercased
+            capability tokens, or None if the agent is not registered
+        """
+        agent_class = self.registry.get_agent_class(agent_id)
+        if not agent_class:
+            if self._capability_cache.pop(agent_id, None):
+                self._requirement_matches.clear()
+            return None
+        
+        cached = self._capability_cache.get(agent_id)
+        if cached and cached['agent_class'] is agent_class:
+            return cached
+        
+        # Create one instance for capability checks and reuse it for later jobs
+        instance = agent_class()
+        capabilities = instance.get_capabilities()
+        tokens = [
+            str(value).lower()
+            for field in CAPABILITY_FIELDS
+            for value in capabilities.get(field, [])
+        ]
+        cached = {
+            'agent_class': agent_class,
+            'instance': instance,
+            'capabilities': capabilities,
+            'caps_tokens': frozenset(tokens),
+            # Unit-separator joined, so substring matches never span two tokens
+            'caps_blob': CAPABILITY_SEPARATOR.join(tokens)
+        }
+        self._capability_cache[agent_id] = cached
+        # Capabilities changed, so the inverted index is stale
+        self._requirement_matches.clear()
+        return cached
+    
+    def _has_capability(self, capabilities: Dict[str, Any], required_lower: str) -> bool:
+        """Check if cached agent capabilities (see _get_cached_capabilities) match a lowercased requirement"""
+        # Exact token hit first, then substring match over specializations,
+        # supported domains and input/output types
+        return required_lower in capabilities['caps_tokens'] or required_lower in capabilities['caps_blob']
     
     def _assign_roles(self, agent_ids: List[str], job: JobRequirement) -> Dict[str, str]:
         """Assign roles to agents based on their capabilities"""
@@ -303,9 +623,9 @@ class TeamOrchestrator:
         # Simple heuristics for strategy selection
         if len(agent_ids) == 1:
             return "single"
-        elif "analysis" in job.description.lower() or "research" in job.description.lower():
+        elif COLLABORATIVE_KEYWORDS.search(job.description):
             return "collaborative"  # Multiple perspectives beneficial
-        elif "urgent" in job.description.lower() or job.priority == "critical":
+        elif job.priority == "critical" or URGENT_KEYWORDS.search(job.description):
             return "parallel"  # Speed is important
         else:
             return self.default_coordination_strategy
@@ -323,21 +643,23 @@ class TeamOrchestrator:
         execution.started_at = datetime.utcnow()
         
         # Update agent workloads
-        for agent_id in team.agents:
-            self.agent_workloads[agent_id] = self.agent_workloads.get(agent_id, 0) + 1
+        self.agent_workloads.update(team.agents)
         
         try:
             logger.info(f"Starting job execution {execution.execution_id} with team {team.team_id}")
             
+            # Resolve agent instances once for every round of the strategy
+            instances = {agent_id: self._get_agent_instance(agent_id) for agent_id in team.agents}
+            
             # Execute based on coordination strategy
             if team.coordination_strategy == "single":
-                results = await self._execute_single_agent(job, team)
+                results = await self._execute_single_agent(job, team, instances)
             elif team.coordination_strategy == "sequential":
-                results = await self._execute_sequential(job, team)
+                results = await self._execute_sequential(job, team, instances)
             elif team.coordination_strategy == "parallel":
-                results = await self._execute_parallel(job, team)
+                results = await self._execute_parallel(job, team, instances)
             elif team.coordination_strategy == "collaborative":
-                results = await self._execute_collaborative(job, team)
+                results = await self._execute_collaborative(job, team, instances)
             else:
                 raise ValueError(f"Unknown coordination strategy: {team.coordination_strategy}")
             
@@ -361,17 +683,64 @@ class TeamOrchestrator:
             execution.completed_at = datetime.utcnow()
             
             # Update agent workloads
-            for agent_id in team.agents:
-                self.agent_workloads[agent_id] = max(0, self.agent_workloads.get(agent_id, 1) - 1)
+            self._release_agents(team.agents)
+            
+            self._retire_team(team)
+    
+    def _retire_team(self, team: TeamConfiguration):
+        """Cleanup a finished job's team in bulk on the next sweep"""
+        self._completed_teams.add(team.team_id)
+        self._ensure_team_sweep()
+    
+    def _ensure_team_sweep(self):
+        """Start the background team sweep if it is not running"""
+        if self._team_sweep_task is None or self._team_sweep_task.done():
+            self._team_sweep_task = asyncio.create_task(self._team_sweep_loop())
+    
+    async def _team_sweep_loop(self):
+        """Periodically drop completed teams from active_teams"""
+        while self._completed_teams:
+            await asyncio.sleep(self.team_sweep_interval)
             
-            # Cleanup team
-            if team.team_id in self.active_teams:
-                del self.active_teams[team.team_id]
+            completed, self._completed_teams = self._completed_teams, set()
+            purged = 0
+            for team_id in completed:
+                if self.active_teams.pop(team_id, None) is not None:
+                    purged += 1
+            
+            # Dicts never shrink on delete; rebuild once most of the table is dead space
+            if purged > len(self.active_teams):
+                self.active_teams = dict(self.active_teams)
+    
+    def _release_agents(self, agent_ids: List[str]):
+        """Drop one job from each agent's workload and wake jobs waiting for a slot"""
+        workloads = self.agent_workloads
+        for agent_id in agent_ids:
+            if workloads[agent_id] > 1:
+                workloads[agent_id] -= 1
+            else:
+                workloads.pop(agent_id, None)
+        self._notify_slot_freed()
+    
+    def _slot_freed_event(self) -> asyncio.Event:
+        """Get the event set when a slot frees up, bound to the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._slot_freed is None or self._slot_freed_loop is not loop:
+            self._slot_freed = asyncio.Event()
+            self._slot_freed_loop = loop
+        return self._slot_freed
     
-    async def _execute_single_agent(self, job: JobRequirement, team: TeamConfiguration) -> Dict[str, Any]:
+    def _notify_slot_freed(self):
+        """Wake queued jobs waiting for an agent to free up"""
+        if self._slot_freed is not None:
+            self._slot_freed.set()
+            self._slot_freed = None
+    
+    async def _execute_single_agent(self, job: JobRequirement, team: TeamConfiguration,
+                                    instances: Dict[str, Optional[BaseAgent]]) -> Dict[str, Any]:
         """Execute job with single agent"""
         agent_id = team.agents[0]
-        agent_instance = self.registry.get_agent_instance(agent_id)
+        agent_instance = instances.get(agent_id)
         
         if not agent_instance:
             raise RuntimeError(f"Cannot get instance of agent {agent_id}")
@@ -385,20 +754,19 @@ class TeamOrchestrator:
             }
         }
     
-    async def _execute_parallel(self, job: JobRequirement, team: TeamConfiguration) -> Dict[str, Any]:
+    async def _execute_parallel(self, job: JobRequirement, team: TeamConfiguration,
+                                instances: Dict[str, Optional[BaseAgent]]) -> Dict[str, Any]:
         """Execute job with agents working in parallel"""
-        tasks = []
-        
+        pending = []
         for agent_id in team.agents:
-            agent_instance = self.registry.get_agent_instance(agent_id)
+            agent_instance = instances.get(agent_id)
             if agent_instance:
-                task = agent_instance.execute(job.description, job.context)
-                tasks.append((agent_id, task))
+                pending.append(self._tagged_execute(agent_id, agent_instance, job.description, job.context))
         
+        # Handle each response as soon as its agent finishes
         results = {}
-        responses = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
-        
-        for (agent_id, _), response in zip(tasks, responses):
+        for next_done in asyncio.as_completed(pending):
+            agent_id, response = await next_done
             if isinstance(response, Exception):
                 results[agent_id] = {
                     "error": str(response),
@@ -412,19 +780,31 @@ class TeamOrchestrator:
         
         return results
     
-    async def _execute_sequential(self, job: JobRequirement, team: TeamConfiguration) -> Dict[str, Any]:
+    @staticmethod
+    async def _tagged_execute(agent_id: str, agent_instance: BaseAgent, message: str,
+                              context: Dict[str, Any]) -> Tuple[str, Any]:
+        """Run an agent and return (agent_id, response or exception)"""
+        try:
+            return agent_id, await agent_instance.execute(message, context)
+        except Exception as e:
+            return agent_id, e
+    
+    async def _execute_sequential(self, job: JobRequirement, team: TeamConfiguration,
+                                  instances: Dict[str, Optional[BaseAgent]]) -> Dict[str, Any]:
         """Execute job with agents working sequentially"""
         results = {}
-        context = job.context.copy()
+        # Per-hop keys go into overrides; job.context is shared read-only, never copied
+        overrides: Dict[str, Any] = {}
+        context = ChainMap(overrides, job.context)
         
         for agent_id in team.agents:
-            agent_instance = self.registry.get_agent_instance(agent_id)
+            agent_instance = instances.get(agent_id)
             if not agent_instance:
                 continue
             
             # Add previous results to context
             if results:
-                context['previous_results'] = results
+                overrides['previous_results'] = results
             
             response = await agent_instance.execute(job.description, context)
             results[agent_id] = {
@@ -434,48 +814,56 @@ class TeamOrchestrator:
             
             # Pass successful results to next agent
             if response.is_success():
-                context['last_successful_output'] = response.content
+                overrides['last_successful_output'] = response.content
         
         return results
     
-    async def _execute_collaborative(self, job: JobRequirement, team: TeamConfiguration) -> Dict[str, Any]:
+    async def _execute_collaborative(self, job: JobRequirement, team: TeamConfiguration,
+                                     instances: Dict[str, Optional[BaseAgent]]) -> Dict[str, Any]:
         """Execute job with collaborative agent interaction"""
-        # First, get initial responses from all agents
-        initial_results = await self._execute_parallel(job, team)
-        
-        # Then, let agents review and refine based on others' work
-        refined_context = job.context.copy()
-        refined_context['peer_responses'] = {
-            agent_id: result.get('response', {}).get('content', '') 
-            for agent_id, result in initial_results.items()
-            if 'response' in result and result['response'].get('status') == 'completed'
-        }
+        members = [(agent_id, instances[agent_id]) for agent_id in team.agents if instances.get(agent_id)]
         
-        # Second round with collaborative context
+        # Agents review and refine based on others' work; the view fills in as round one completes
+        initial_results: Dict[str, Any] = {}
+        refined_context = ChainMap({'peer_responses': _PeerResponsesView(initial_results)}, job.context)
         collaboration_prompt = f"Original task: {job.description}\n\nConsidering peer insights, provide your refined response."
         
-        refined_tasks = []
-        for agent_id in team.agents:
-            agent_instance = self.registry.get_agent_instance(agent_id)
-            if agent_instance:
-                task = agent_instance.execute(collaboration_prompt, refined_context)
-                refined_tasks.append((agent_id, task))
-        
-        refined_results = {}
-        responses = await asyncio.gather(*[task for _, task in refined_tasks], return_exceptions=True)
+        # Barrier between rounds (asyncio.Barrier needs Python 3.11, so count arrivals instead)
+        waiting = len(members)
+        round_one_done = asyncio.Event()
         
-        for (agent_id, _), response in zip(refined_tasks, responses):
-            if isinstance(response, Exception):
+        async def collaborate(agent_id: str, agent_instance: BaseAgent) -> Tuple[str, Dict[str, Any]]:
+            nonlocal waiting
+            role = team.roles.get(agent_id, "unknown")
+            
+            # First, get the agent's initial response
+            try:
+                response = await agent_instance.execute(job.description, job.context)
+                initial_results[agent_id] = {"response": response.to_dict(), "role": role}
+            except Exception as e:
+                initial_results[agent_id] = {"error": str(e), "role": role}
+            finally:
+                waiting -= 1
+                if waiting == 0:
+                    round_one_done.set()
+            
+            # Second round with collaborative context, once every peer has answered
+            await round_one_done.wait()
+            try:
+                refined = await agent_instance.execute(collaboration_prompt, refined_context)
+            except Exception as e:
                 # Fall back to initial result if refinement fails
-                refined_results[agent_id] = initial_results.get(agent_id, {"error": str(response)})
-            else:
-                refined_results[agent_id] = {
-                    "initial_response": initial_results.get(agent_id, {}),
-                    "refined_response": response.to_dict(),
-                    "role": team.roles.get(agent_id, "unknown")
-                }
+                return agent_id, initial_results.get(agent_id, {"error": str(e)})
+            
+            return agent_id, {
+                "initial_response": initial_results.get(agent_id, {}),
+                "refined_response": refined.to_dict(),
+                "role": role
+            }
         
-        return refined_results
+        return dict(await asyncio.gather(*[
+            collaborate(agent_id, agent_instance) for agent_id, agent_instance in members
+        ]))
     
     def _evaluate_team_performance(self, team: TeamConfiguration, results: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate team performance for this execution"""
@@ -497,25 +885,19 @@ class TeamOrchestrator:
         if not execution:
             return None
         
-        result = {
-            "execution_id": execution.execution_id,
-            "job_id": execution.job_id,
-            "team_id": execution.team_id,
-            "status": execution.status,
-            "started_at": execution.started_at.isoformat() if execution.started_at else None,
-            "completed_at": execution.completed_at.isoformat() if execution.completed_at else None,
-            "error_message": execution.error_message
-        }
+        # Reuse the last serialization until the execution changes state; callers get their own copy
+        if execution._cached_status is not None:
+            return dict(execution._cached_status)
         
-        if execution.results:
-            result["results"] = execution.results
+        result = execution.to_dict()
         
         # Add team info if available
         team = self.active_teams.get(execution.team_id)
-        if team:
+        if team and team.team_id not in self._completed_teams:
             result["team"] = team.to_dict()
         
-        return result
+        execution._cached_status = result
+        return dict(result)
     
     def list_active_executions(self) -> List[Dict[str, Any]]:
         """List all active job executions"""
@@ -526,7 +908,7 @@ class TeamOrchestrator:
     
     def get_agent_workloads(self) -> Dict[str, int]:
         """Get current workload for all agents"""
-        return self.agent_workloads.copy()
+        return dict(self.agent_workloads)
     
     def cancel_execution(self, execution_id: str) -> bool:
         """Cancel a running execution"""
@@ -534,15 +916,19 @@ class TeamOrchestrator:
         if not execution or execution.status not in ["queued", "running"]:
             return False
         
+        was_queued = execution.status == "queued"
         execution.status = "cancelled"
         execution.completed_at = datetime.utcnow()
         execution.error_message = "Execution cancelled by user"
         
-        # Update agent workloads
-        team = self.active_teams.get(execution.team_id)
-        if team:
-            for agent_id in team.agents:
-                self.agent_workloads[agent_id] = max(0, self.agent_workloads.get(agent_id, 1) - 1)
+        # Update agent workloads (queued jobs only hold a reservation)
+        if was_queued:
+            self._unreserve_agents(execution_id)
+            self._notify_slot_freed()
+        else:
+            team = self.active_teams.get(execution.team_id)
+            if team:
+                self._release_agents(team.agents)
         
         return True
 
@@ -3,26 +3,47 @@ JuniorGPT - Secure Multi-Agent AI Assistant
 Enhanced version with modular architecture and security improvements
 """
 import asyncio
+import atexit
+import concurrent.futures
+import decimal
+import gzip
+import hashlib
 import os
+import queue
+import re
 import sys
+import threading
 from typing import Dict, List, Optional, Any, Tuple
 import logging
 import uuid
 import time
+from collections import OrderedDict
 from datetime import datetime
 
 # Flask and web components
-from flask import Flask, render_template_string, request, jsonify, Response, session
-from flask import stream_template
+from flask import Flask, request, jsonify, Response, session
+from flask import stream_template, stream_with_context
+from flask.json.provider import JSONProvider
 from markupsafe import Markup
+from sqlalchemy import text
+
+try:
+    import orjson
+except ImportError:  # Optional; Flask's stdlib JSON provider is used instead
+    orjson = None
+
+try:
+    import redis
+except ImportError:  # Optional; conversation histories then stay in each process
+    redis = None
 
 # Add project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import our modules
 from config import Config, get_config
-from models import init_db, Conversation, Agent
-from services import AgentService, ModelService, ConversationService
+from models import init_db, Conversation, ConversationTurn, Agent
+from services import AgentService, ModelService, ConversationService, ResponseCache
 from utils.security import SecurityUtils
 from utils.logging_config import setup_logging, get_logger
 
@@ -41,9 +62,29 @@ logger = setup_logging(
     include_console=True
 )
 
+class OrjsonProvider(JSONProvider):
+    """JSON provider serializing with orjson"""
+    
+    @staticmethod
+    def _default(obj):
+        # Types Flask's default provider handles that orjson does not
+        if isinstance(obj, decimal.Decimal):
+            return str(obj)
+        if hasattr(obj, '__html__'):
+            return str(obj.__html__())
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self._default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__)
 app.secret_key = config.SECRET_KEY
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # Initialize database
 try:
@@ -53,587 +94,204 @@ except Exception as e:
     logger.error(f"Failed to initialize database: {e}")
     sys.exit(1)
 
+@app.teardown_appcontext
+def remove_db_session(exception=None):
+    """Release the request thread's scoped session"""
+    db.remove_scoped_session()
+
 # Initialize services
 try:
     model_service = ModelService(config)
     agent_service = AgentService(model_service)
     conversation_service = ConversationService()
+    response_cache = ResponseCache(ttl=config.RESPONSE_CACHE_TTL, max_entries=config.RESPONSE_CACHE_SIZE)
     security = SecurityUtils()
     logger.info("Services initialized successfully")
 except Exception as e:
     logger.error(f"Failed to initialize services: {e}")
     sys.exit(1)
 
-# Global state for conversations
-active_conversations = {}
-
-# HTML Template with security improvements
-HTML_TEMPLATE = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="csrf-token" content="{{ csrf_token }}">
-    <title>JuniorGPT - Secure AI Assistant</title>
-    <style>
-        :root {
-            --primary-color: #2563eb;
-            --secondary-color: #64748b;
-            --success-color: #10b981;
-            --danger-color: #ef4444;
-            --warning-color: #f59e0b;
-            --bg-color: #f8fafc;
-            --surface-color: #ffffff;
-            --text-color: #1e293b;
-            --border-color: #e2e8f0;
-        }
-        
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background-color: var(--bg-color);
-            color: var(--text-color);
-            line-height: 1.6;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-        }
-        
-        .header {
-            background: var(--surface-color);
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        
-        .header h1 {
-            color: var(--primary-color);
-            margin-bottom: 10px;
-        }
-        
-        .header p {
-            color: var(--secondary-color);
-            margin: 0;
-        }
-        
-        .main-content {
-            display: grid;
-            grid-template-columns: 1fr 300px;
-            gap: 20px;
-            flex: 1;
-        }
-        
-        .chat-container {
-            background: var(--surface-color);
-            border-radius: 10px;
-            padding: 20px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            display: flex;
-            flex-direction: column;
-            height: 600px;
-        }
-        
-        .messages {
-            flex: 1;
-            overflow-y: auto;
-            margin-bottom: 20px;
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            padding: 15px;
-        }
-        
-        .message {
-            margin-bottom: 15px;
-            padding: 12px;
-            border-radius: 8px;
-            max-width: 80%;
-        }
-        
-        .message.user {
-            background: var(--primary-color);
-            color: white;
-            margin-left: auto;
-        }
-        
-        .message.assistant {
-            background: #f1f5f9;
-            border-left: 4px solid var(--success-color);
-        }
-        
-        .message.error {
-            background: #fef2f2;
-            border-left: 4px solid var(--danger-color);
-            color: var(--danger-color);
-        }
-        
-        .agent-badge {
-            display: inline-block;
-            background: var(--success-color);
-            color: white;
-            padding: 2px 8px;
-            border-radius: 12px;
-            font-size: 0.8em;
-            margin-right: 5px;
-            margin-bottom: 5px;
-        }
-        
-        .input-container {
-            display: flex;
-            gap: 10px;
-        }
-        
-        .input-field {
-            flex: 1;
-            padding: 12px;
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            font-size: 16px;
-        }
-        
-        .send-button {
-            background: var(--primary-color);
-            color: white;
-            border: none;
-            padding: 12px 24px;
-            border-radius: 8px;
-            cursor: pointer;
-            font-size: 16px;
-            transition: background-color 0.2s;
-        }
-        
-        .send-button:hover {
-            background: #1d4ed8;
-        }
-        
-        .send-button:disabled {
-            background: var(--secondary-color);
-            cursor: not-allowed;
-        }
-        
-        .sidebar {
-            background: var(--surface-color);
-            border-radius: 10px;
-            padding: 20px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            height: fit-content;
-        }
-        
-        .agent-list h3 {
-            margin-bottom: 15px;
-            color: var(--primary-color);
-        }
-        
-        .agent-item {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 10px;
-            border: 1px solid var(--border-color);
-            border-radius: 6px;
-            margin-bottom: 8px;
-        }
-        
-        .agent-item.active {
-            border-color: var(--success-color);
-            background: #f0fdf4;
-        }
-        
-        .agent-toggle {
-            width: 40px;
-            height: 20px;
-            background: var(--secondary-color);
-            border-radius: 10px;
-            cursor: pointer;
-            position: relative;
-            transition: background-color 0.2s;
-        }
-        
-        .agent-toggle.active {
-            background: var(--success-color);
-        }
-        
-        .agent-toggle::after {
-            content: '';
-            position: absolute;
-            width: 16px;
-            height: 16px;
-            background: white;
-            border-radius: 50%;
-            top: 2px;
-            left: 2px;
-            transition: left 0.2s;
-        }
-        
-        .agent-toggle.active::after {
-            left: 22px;
-        }
-        
-        .thinking-panel {
-            background: #fefce8;
-            border: 1px solid #facc15;
-            border-radius: 8px;
-            padding: 15px;
-            margin-top: 20px;
-            max-height: 200px;
-            overflow-y: auto;
-        }
-        
-        .thinking-header {
-            font-weight: bold;
-            color: #92400e;
-            margin-bottom: 10px;
-        }
-        
-        .thinking-trace {
-            margin-bottom: 10px;
-            padding: 8px;
-            background: white;
-            border-radius: 4px;
-            font-size: 0.9em;
-        }
-        
-        .status-indicator {
-            display: inline-block;
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            margin-right: 8px;
-        }
-        
-        .status-indicator.online {
-            background: var(--success-color);
-        }
-        
-        .status-indicator.offline {
-            background: var(--danger-color);
-        }
-        
-        .loading {
-            display: none;
-            text-align: center;
-            padding: 10px;
-            color: var(--secondary-color);
-        }
-        
-        .error-message {
-            background: #fef2f2;
-            border: 1px solid #fecaca;
-            color: var(--danger-color);
-            padding: 10px;
-            border-radius: 8px;
-            margin-bottom: 10px;
-        }
-        
-        @media (max-width: 768px) {
-            .main-content {
-                grid-template-columns: 1fr;
-            }
-            
-            .container {
-                padding: 10px;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header class="header">
-            <h1>🤖 JuniorGPT - Secure AI Assistant</h1>
-            <p>Multi-agent AI system with enhanced security and modular architecture</p>
-        </header>
-        
-        <div class="main-content">
-            <div class="chat-container">
-                <div class="messages" id="messages">
-                    <div class="message assistant">
-                        <strong>JuniorGPT System:</strong><br>
-                        Welcome! I'm your secure AI assistant with 14 specialized agents ready to help.
-                        Type your message below to get started.
-                    </div>
-                </div>
-                
-                <div class="input-container">
-                    <input 
-                        type="text" 
-                        id="messageInput" 
-                        class="input-field" 
-                        placeholder="Type your message here..."
-                        maxlength="10000"
-                        autocomplete="off"
-                    />
-                    <button id="sendButton" class="send-button">Send</button>
-                </div>
-                
-                <div class="loading" id="loading">
-                    <span>Processing your request...</span>
-                </div>
-            </div>
-            
-            <div class="sidebar">
-                <div class="agent-list">
-                    <h3>🔧 Active Agents</h3>
-                    <div id="agentList">
-                        <!-- Agents will be loaded here -->
-                    </div>
-                </div>
-                
-                <div class="thinking-panel" id="thinkingPanel" style="display: none;">
-                    <div class="thinking-header">🧠 Agent Thinking Process</div>
-                    <div id="thinkingContent">
-                        <!-- Thinking traces will appear here -->
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        class JuniorGPT {
-            constructor() {
-                this.conversationId = this.generateUUID();
-                this.messageInput = document.getElementById('messageInput');
-                this.sendButton = document.getElementById('sendButton');
-                this.messages = document.getElementById('messages');
-                this.loading = document.getElementById('loading');
-                this.agentList = document.getElementById('agentList');
-                this.thinkingPanel = document.getElementById('thinkingPanel');
-                this.thinkingContent = document.getElementById('thinkingContent');
-                
-                this.agents = {};
-                this.isProcessing = false;
-                
-                this.init();
-            }
-            
-            generateUUID() {
-                return 'xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx'.replace(/[xy]/g, function(c) {
-                    const r = Math.random() * 16 | 0;
-                    const v = c == 'x' ? r : (r & 0x3 | 0x8);
-                    return v.toString(16);
-                });
-            }
-            
-            async init() {
-                await this.loadAgents();
-                this.setupEventListeners();
-            }
-            
-            setupEventListeners() {
-                this.sendButton.addEventListener('click', () => this.sendMessage());
-                this.messageInput.addEventListener('keypress', (e) => {
-                    if (e.key === 'Enter' && !e.shiftKey) {
-                        e.preventDefault();
-                        this.sendMessage();
-                    }
-                });
-            }
-            
-            async loadAgents() {
-                try {
-                    const response = await fetch('/api/agents');
-                    const agents = await response.json();
-                    
-                    this.agents = {};
-                    this.agentList.innerHTML = '';
-                    
-                    agents.forEach(agent => {
-                        this.agents[agent.agent_id] = agent;
-                        this.createAgentElement(agent);
-                    });
-                } catch (error) {
-                    console.error('Failed to load agents:', error);
-                }
-            }
-            
-            createAgentElement(agent) {
-                const agentDiv = document.createElement('div');
-                agentDiv.className = `agent-item ${agent.is_active ? 'active' : ''}`;
-                agentDiv.innerHTML = `
-                    <div>
-                        <div style="font-weight: bold;">${agent.name}</div>
-                        <div style="font-size: 0.8em; color: #64748b;">${agent.description}</div>
-                    </div>
-                    <div class="agent-toggle ${agent.is_active ? 'active' : ''}" 
-                         onclick="app.toggleAgent('${agent.agent_id}')"></div>
-                `;
-                this.agentList.appendChild(agentDiv);
-            }
-            
-            async toggleAgent(agentId) {
-                try {
-                    const agent = this.agents[agentId];
-                    const newStatus = !agent.is_active;
-                    
-                    const response = await fetch('/api/agents/toggle', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                            'X-CSRF-Token': document.querySelector('meta[name="csrf-token"]').content
-                        },
-                        body: JSON.stringify({
-                            agent_id: agentId,
-                            active: newStatus
-                        })
-                    });
-                    
-                    if (response.ok) {
-                        await this.loadAgents();
-                    }
-                } catch (error) {
-                    console.error('Failed to toggle agent:', error);
-                }
-            }
-            
-            async sendMessage() {
-                const message = this.messageInput.value.trim();
-                if (!message || this.isProcessing) return;
-                
-                this.isProcessing = true;
-                this.updateUI(true);
-                
-                // Add user message to chat
-                this.addMessage(message, 'user');
-                this.messageInput.value = '';
-                
-                try {
-                    const response = await fetch('/api/chat', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                            'X-CSRF-Token': document.querySelector('meta[name="csrf-token"]').content
-                        },
-                        body: JSON.stringify({
-                            message: message,
-                            conversation_id: this.conversationId
-                        })
-                    });
-                    
-                    if (!response.ok) {
-                        throw new Error(`HTTP error! status: ${response.status}`);
-                    }
-                    
-                    const data = await response.json();
-                    
-                    if (data.success) {
-                        this.addMessage(data.response, 'assistant', data.agents_used);
-                        this.showThinkingTraces(data.thinking_traces);
-                    } else {
-                        this.addMessage(data.error || 'An error occurred', 'error');
-                    }
-                    
-                } catch (error) {
-                    console.error('Error sending message:', error);
-                    this.addMessage('Failed to send message. Please try again.', 'error');
-                } finally {
-                    this.isProcessing = false;
-                    this.updateUI(false);
-                }
-            }
-            
-            addMessage(text, type, agents = []) {
-                const messageDiv = document.createElement('div');
-                messageDiv.className = `message ${type}`;
-                
-                let content = '';
-                if (type === 'assistant' && agents && agents.length > 0) {
-                    const agentBadges = agents.map(agentId => {
-                        const agent = this.agents[agentId];
-                        return `<span class="agent-badge">${agent ? agent.name : agentId}</span>`;
-                    }).join('');
-                    content = agentBadges + '<br>';
-                }
-                
-                content += this.escapeHtml(text);
-                messageDiv.innerHTML = content;
-                
-                this.messages.appendChild(messageDiv);
-                this.messages.scrollTop = this.messages.scrollHeight;
-            }
-            
-            showThinkingTraces(traces) {
-                if (!traces || Object.keys(traces).length === 0) {
-                    this.thinkingPanel.style.display = 'none';
-                    return;
-                }
-                
-                this.thinkingContent.innerHTML = '';
-                
-                Object.entries(traces).forEach(([agentId, trace]) => {
-                    const traceDiv = document.createElement('div');
-                    traceDiv.className = 'thinking-trace';
-                    traceDiv.innerHTML = `
-                        <strong>${trace.agent_name}:</strong><br>
-                        ${this.escapeHtml(trace.thinking)}
-                    `;
-                    this.thinkingContent.appendChild(traceDiv);
-                });
-                
-                this.thinkingPanel.style.display = 'block';
-            }
-            
-            updateUI(processing) {
-                this.sendButton.disabled = processing;
-                this.messageInput.disabled = processing;
-                this.loading.style.display = processing ? 'block' : 'none';
-                
-                if (processing) {
-                    this.sendButton.textContent = 'Processing...';
-                } else {
-                    this.sendButton.textContent = 'Send';
-                    this.messageInput.focus();
-                }
-            }
-            
-            escapeHtml(unsafe) {
-                return unsafe
-                    .replace(/&/g, "&amp;")
-                    .replace(/</g, "&lt;")
-                    .replace(/>/g, "&gt;")
-                    .replace(/"/g, "&quot;")
-                    .replace(/'/g, "&#039;")
-                    .replace(/\n/g, "<br>");
-            }
-        }
-        
-        // Initialize app when DOM is loaded
-        let app;
-        document.addEventListener('DOMContentLoaded', () => {
-            app = new JuniorGPT();
-        });
-    </script>
-</body>
-</html>
-'''
-
-@app.before_request
-def generate_csrf_token():
-    """Generate CSRF token for each request"""
-    if 'csrf_token' not in session:
-        session['csrf_token'] = security.generate_csrf_token()
+# Persistent event loop for agent work, shared by all request threads
+agent_loop = asyncio.new_event_loop()
+threading.Thread(target=agent_loop.run_forever, name="agent-loop", daemon=True).start()
+atexit.register(agent_loop.call_soon_threadsafe, agent_loop.stop)
+
+# Loads conversation history from the database while agent detection runs on the request thread
+history_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="history")
+atexit.register(history_executor.shutdown, wait=False)
+
+def run_on_agent_loop(coro, timeout: Optional[float] = None):
+    """Run a coroutine on the agent event loop and wait for its result"""
+    future = asyncio.run_coroutine_threadsafe(coro, agent_loop)
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+def iterate_on_agent_loop(async_iterator):
+    """Drive an async iterator on the agent event loop, yielding its items to a sync caller"""
+    items = queue.Queue()
+    finished = object()
+    
+    async def pump():
+        try:
+            async for item in async_iterator:
+                items.put(item)
+        except Exception as e:
+            items.put(e)
+        finally:
+            items.put(finished)
+    
+    future = asyncio.run_coroutine_threadsafe(pump(), agent_loop)
+    try:
+        while True:
+            item = items.get()
+            if item is finished:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # Stops the agents if the client disconnected mid-stream
+        future.cancel()
+
+# Recent conversation histories (formatted for agent context), refreshed on every save
+# so follow-up messages skip the history query: conversation_id -> (expires_at, history)
+active_conversations: "OrderedDict[str, Tuple[float, List[Dict[str, str]]]]" = OrderedDict()
+_active_conversations_lock = threading.Lock()
+MAX_ACTIVE_CONVERSATIONS = 1000
+ACTIVE_CONVERSATION_TTL = 3600
+LOCAL_CONVERSATION_TTL = 300  # seconds
+
+# Another worker may save the next turn, so an in-process history is only trusted in a single process
+# (gunicorn.conf.py exports its worker count as WEB_CONCURRENCY)
+SINGLE_WORKER = int(os.getenv('WEB_CONCURRENCY', '1')) <= 1
+CONVERSATION_HISTORY_LIMIT = 10
+
+# With REDIS_URL set, histories live in Redis instead so every gunicorn worker sees each save
+history_store = None
+if config.REDIS_URL:
+    if redis is None:
+        logger.warning("REDIS_URL is set but redis is not installed; not sharing conversation histories")
+    else:
+        history_store = redis.Redis.from_url(config.REDIS_URL)
+if history_store is None and not SINGLE_WORKER:
+    logger.info("Multiple workers without REDIS_URL; conversation histories are read from the database")
+
+def _get_active_history(conversation_id: str) -> Optional[List[Dict[str, str]]]:
+    """Get a recently saved conversation history, or None if it must be queried"""
+    if history_store is not None:
+        try:
+            stored = history_store.get(f"conv:{conversation_id}")
+        except redis.RedisError as e:
+            logger.warning(f"Conversation history lookup failed: {e}")
+            return None
+        return app.json.loads(stored) if stored is not None else None
+    
+    if not SINGLE_WORKER:
+        return None
+    
+    with _active_conversations_lock:
+        entry = active_conversations.get(conversation_id)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del active_conversations[conversation_id]
+            return None
+        active_conversations.move_to_end(conversation_id)
+        return entry[1]
+
+def _set_active_history(conversation_id: str, history: List[Dict[str, str]]):
+    """Remember a conversation's history for its next message"""
+    if history_store is not None:
+        try:
+            history_store.setex(f"conv:{conversation_id}", ACTIVE_CONVERSATION_TTL, app.json.dumps(history))
+        except redis.RedisError as e:
+            logger.warning(f"Conversation history store failed: {e}")
+        return
+    
+    if not SINGLE_WORKER:
+        return
+    
+    with _active_conversations_lock:
+        active_conversations[conversation_id] = (time.monotonic() + LOCAL_CONVERSATION_TTL, history)
+        active_conversations.move_to_end(conversation_id)
+        while len(active_conversations) > MAX_ACTIVE_CONVERSATIONS:
+            active_conversations.popitem(last=False)
+
+# Short-lived cache for polled read-only endpoints: key -> (expires_at, value)
+_api_cache: Dict[str, Tuple[float, Any]] = {}
+AGENTS_CACHE_TTL = 5  # seconds
+STATS_CACHE_TTL = 30  # seconds
+
+def _cached(key: str, ttl: float, loader):
+    """Return a cached value, calling loader() when it is missing or older than ttl seconds"""
+    now = time.monotonic()
+    entry = _api_cache.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+    
+    value = loader()
+    _api_cache[key] = (now + ttl, value)
+    return value
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+# The stylesheet is minified and compressed once; its URL carries a content hash so it can be cached forever
+with open(os.path.join(app.static_folder, 'app.css'), encoding='utf-8') as css_file:
+    _APP_CSS = _minify_css(css_file.read()).encode('utf-8')
+_APP_CSS_GZ = gzip.compress(_APP_CSS, 9)
+_APP_CSS_VERSION = hashlib.sha256(_APP_CSS).hexdigest()[:12]
+
+# The page is static (per-page values come from /api/session), so read and compress it once
+with open(os.path.join(app.static_folder, 'index.html'), 'rb') as index_file:
+    _HOME_HTML = index_file.read().replace(
+        b'href="/app.css"', f'href="/app.css?v={_APP_CSS_VERSION}"'.encode('utf-8')
+    )
+_HOME_HTML_GZ = gzip.compress(_HOME_HTML, 9)
 
 @app.route('/')
 def home():
     """Main application route"""
-    return render_template_string(HTML_TEMPLATE, csrf_token=session.get('csrf_token', ''))
+    headers = {'Cache-Control': 'private, max-age=3600', 'Vary': 'Accept-Encoding'}
+    if request.accept_encodings.quality('gzip') > 0:
+        headers['Content-Encoding'] = 'gzip'
+        return Response(_HOME_HTML_GZ, mimetype='text/html', headers=headers)
+    return Response(_HOME_HTML, mimetype='text/html', headers=headers)
+
+@app.route('/app.css')
+def app_css():
+    """Minified application stylesheet"""
+    headers = {'Cache-Control': 'public, max-age=31536000, immutable', 'Vary': 'Accept-Encoding'}
+    if request.accept_encodings.quality('gzip') > 0:
+        headers['Content-Encoding'] = 'gzip'
+        return Response(_APP_CSS_GZ, mimetype='text/css', headers=headers)
+    return Response(_APP_CSS, mimetype='text/css', headers=headers)
+
+@app.route('/api/session')
+def get_session_info():
+    """Get the CSRF token and a new conversation ID for a page load"""
+    # Only this endpoint issues CSRF tokens, so other requests never touch the session cookie
+    if 'csrf_token' not in session:
+        session['csrf_token'] = security.generate_csrf_token()
+    
+    return jsonify({
+        "csrf_token": session['csrf_token'],
+        "conversation_id": str(uuid.uuid4())
+    })
 
 @app.route('/api/agents')
 def get_agents():
     """Get all active agents"""
     try:
-        agents = agent_service.get_active_agents()
+        agents = _cached('agents', AGENTS_CACHE_TTL, agent_service.get_active_agents)
         return jsonify(agents)
     except Exception as e:
         logger.error(f"Failed to get agents: {e}")
@@ -657,6 +315,8 @@ def toggle_agent():
         
         success = agent_service.toggle_agent(agent_id, active)
         if success:
+            # Agent list and statistics changed
+            _api_cache.clear()
             return jsonify({"success": True})
         else:
             return jsonify({"error": "Failed to toggle agent"}), 400
@@ -665,6 +325,92 @@ def toggle_agent():
         logger.error(f"Failed to toggle agent: {e}")
         return jsonify({"error": "Internal server error"}), 500
 
+def _parse_chat_request() -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[Response, int]]]:
+    """
+    Validate a chat request and gather the agents and history it needs
+    
+    Returns:
+        (agent_service keyword arguments, None) or (None, error response)
+    """
+    data = request.get_json()
+    message = data.get('message', '').strip()
+    conversation_id = data.get('conversation_id')
+    
+    if not message:
+        return None, (jsonify({"error": "Message is required"}), 400)
+    
+    # Validate message input
+    is_valid, error_msg = security.validate_message_input(message)
+    if not is_valid:
+        return None, (jsonify({"error": error_msg}), 400)
+    
+    # Get conversation history for context (kept in memory after each saved turn);
+    # on a miss, query the database in the background while agents are detected
+    conversation_history = []
+    history_future = None
+    if conversation_id:
+        conversation_history = _get_active_history(conversation_id)
+        if conversation_history is None:
+            history_future = history_executor.submit(
+                conversation_service.get_conversation_turns,
+                conversation_id, limit=CONVERSATION_HISTORY_LIMIT
+            )
+    
+    # Auto-detect agents
+    detected_agents = agent_service.auto_detect_agents(message)
+    
+    if history_future is not None:
+        conversation_history = _format_history(history_future.result())
+    
+    return {
+        "message": message,
+        "agent_ids": detected_agents,
+        "conversation_id": conversation_id,
+        "conversation_history": conversation_history
+    }, None
+
+def _format_history(history: List[ConversationTurn]) -> List[Dict[str, str]]:
+    """Format stored conversation turns as agent context"""
+    return [
+        {
+            "user": turn.user_input,
+            "assistant": turn.agent_response
+        }
+        for turn in history
+    ]
+
+def _save_chat_result(chat_args: Dict[str, Any], result: Dict[str, Any]) -> Optional[str]:
+    """Save a successful agent result and return its conversation ID"""
+    # The insert also reads back the history the next message in this conversation needs
+    saved_conversation_id, history = conversation_service.create_conversation_with_history(
+        user_input=chat_args["message"],
+        agent_response=result["response"],
+        conversation_id=chat_args["conversation_id"],
+        history_limit=CONVERSATION_HISTORY_LIMIT,
+        agents_used=result["agents_used"],
+        response_time=result["response_time"],
+        thinking_trace=result["thinking_traces"]
+    )
+    
+    if saved_conversation_id:
+        _set_active_history(saved_conversation_id, _format_history(history))
+    
+    return saved_conversation_id or chat_args["conversation_id"]
+
+def _get_cached_chat_result(chat_args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Get a cached agent result for a chat request, if one applies"""
+    # Follow-ups depend on earlier turns, so only context-free messages are served from cache
+    if not config.RESPONSE_CACHE_TTL or chat_args["conversation_history"]:
+        return None
+    return response_cache.get(chat_args["message"], chat_args["agent_ids"])
+
+def _cache_chat_result(chat_args: Dict[str, Any], result: Dict[str, Any]):
+    """Cache a successful agent result for context-free messages"""
+    if config.RESPONSE_CACHE_TTL and not chat_args["conversation_history"] and result["success"]:
+        response_cache.set(chat_args["message"], chat_args["agent_ids"], {
+            key: result[key] for key in ("success", "response", "agents_used", "thinking_traces", "response_time")
+        })
+
 @app.route('/api/chat', methods=['POST'])
 def chat():
     """Main chat endpoint"""
@@ -674,60 +420,30 @@ def chat():
         return jsonify({"error": "Invalid CSRF token"}), 403
     
     try:
-        data = request.get_json()
-        message = data.get('message', '').strip()
-        conversation_id = data.get('conversation_id')
+        chat_args, error_response = _parse_chat_request()
+        if error_response:
+            return error_response
         
-        if not message:
-            return jsonify({"error": "Message is required"}), 400
-        
-        # Validate message input
-        is_valid, error_msg = security.validate_message_input(message)
-        if not is_valid:
-            return jsonify({"error": error_msg}), 400
-        
-        # Auto-detect agents
-        detected_agents = agent_service.auto_detect_agents(message)
-        
-        # Get conversation history for context
-        conversation_history = []
-        if conversation_id:
-            history = conversation_service.get_conversation_history(conversation_id, limit=10)
-            conversation_history = [
-                {
-                    "user": conv["user_input"],
-                    "assistant": conv["agent_response"]
-                }
-                for conv in history
-            ]
-        
-        # Process with agents
-        result = asyncio.run(agent_service.process_with_agents(
-            message=message,
-            agent_ids=detected_agents,
-            conversation_id=conversation_id,
-            conversation_history=conversation_history
-        ))
+        # Process with agents, unless the same message was answered recently
+        result = _get_cached_chat_result(chat_args)
+        cache_status = "HIT" if result else "MISS"
+        if not result:
+            result = run_on_agent_loop(agent_service.process_with_agents(**chat_args))
+            _cache_chat_result(chat_args, result)
         
         if result["success"]:
-            # Save conversation
-            saved_conversation_id = conversation_service.create_conversation(
-                user_input=message,
-                agent_response=result["response"],
-                conversation_id=conversation_id,
-                agents_used=result["agents_used"],
-                response_time=result["response_time"],
-                thinking_trace=result["thinking_traces"]
-            )
-            
-            return jsonify({
+            # Encoded in one pass by the app's JSON provider; splicing separately encoded
+            # fields into a pre-built bytes skeleton benchmarked slower under orjson
+            response = jsonify({
                 "success": True,
                 "response": result["response"],
                 "agents_used": result["agents_used"],
                 "thinking_traces": result["thinking_traces"],
                 "response_time": result["response_time"],
-                "conversation_id": saved_conversation_id or conversation_id
+                "conversation_id": _save_chat_result(chat_args, result)
             })
+            response.headers['X-Cache'] = cache_status
+            return response
         else:
             return jsonify({
                 "success": False,
@@ -739,18 +455,65 @@ def chat():
         logger.error(f"Chat endpoint error: {e}")
         return jsonify({"error": "Internal server error"}), 500
 
-@app.route('/api/health')
-def health_check():
-    """Health check endpoint"""
+@app.route('/api/chat/stream', methods=['POST'])
+def chat_stream():
+    """Chat endpoint streaming each agent's output as Server-Sent Events"""
+    # Validate CSRF token
+    csrf_token = request.headers.get('X-CSRF-Token')
+    if not security.validate_csrf_token(csrf_token, session.get('csrf_token')):
+        return jsonify({"error": "Invalid CSRF token"}), 403
+    
+    try:
+        chat_args, error_response = _parse_chat_request()
+        if error_response:
+            return error_response
+    except Exception as e:
+        logger.error(f"Chat stream endpoint error: {e}")
+        return jsonify({"error": "Internal server error"}), 500
+    
+    cached = _get_cached_chat_result(chat_args)
+    
+    def generate():
+        try:
+            if cached:
+                events = iter([{"type": "result", **cached}])
+            else:
+                events = iterate_on_agent_loop(agent_service.stream_with_agents(**chat_args))
+            
+            for event in events:
+                if event["type"] == "result":
+                    event.pop("execution_ids", None)
+                    if event["success"]:
+                        if not cached:
+                            _cache_chat_result(chat_args, event)
+                        event["conversation_id"] = _save_chat_result(chat_args, event)
+                yield f"data: {app.json.dumps(event)}\n\n"
+        except Exception as e:
+            logger.error(f"Chat stream error: {e}")
+            yield f"data: {app.json.dumps({'type': 'result', 'success': False, 'error': 'Internal server error'})}\n\n"
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no', 'X-Cache': "HIT" if cached else "MISS"}
+    )
+
+# Health is probed in the background; the endpoint only reports the latest result
+HEALTH_CHECK_INTERVAL = 10  # seconds between probes
+HEALTH_MAX_AGE = 30  # seconds before the last probe counts as stale
+_health_snapshot: Optional[Tuple[float, Dict[str, Any], int]] = None  # (probed_at, payload, status code)
+
+def _probe_health() -> Tuple[Dict[str, Any], int]:
+    """Check database and model service, returning (payload, status code)"""
     try:
         # Check database
         with db.get_session() as session:
-            session.execute("SELECT 1")
+            session.execute(text("SELECT 1"))
         
         # Check model service
         available_models = model_service.get_available_models()
         
-        return jsonify({
+        return {
             "status": "healthy",
             "timestamp": datetime.utcnow().isoformat(),
             "database": "connected",
@@ -759,26 +522,47 @@ def health_check():
                 "anthropic": len(available_models.get("anthropic", [])),
                 "local": len(available_models.get("local", []))
             }
-        })
+        }, 200
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return jsonify({
+        return {
             "status": "unhealthy",
+            "timestamp": datetime.utcnow().isoformat(),
             "error": str(e)
-        }), 500
+        }, 500
+
+def _health_probe_loop():
+    """Refresh the health snapshot every HEALTH_CHECK_INTERVAL seconds"""
+    global _health_snapshot
+    while True:
+        payload, status_code = _probe_health()
+        _health_snapshot = (time.monotonic(), payload, status_code)
+        time.sleep(HEALTH_CHECK_INTERVAL)
+
+threading.Thread(target=_health_probe_loop, name="health-probe", daemon=True).start()
+
+@app.route('/api/health')
+def health_check():
+    """Health check endpoint"""
+    snapshot = _health_snapshot
+    if snapshot is None:
+        return jsonify({"status": "starting"}), 503
+    
+    probed_at, payload, status_code = snapshot
+    if time.monotonic() - probed_at > HEALTH_MAX_AGE:
+        return jsonify({"status": "stale", "last_check": payload}), 503
+    
+    return jsonify(payload), status_code
 
 @app.route('/api/stats')
 def get_stats():
     """Get system statistics"""
     try:
-        conversation_stats = conversation_service.get_conversation_statistics()
-        agent_stats = agent_service.get_agent_statistics()
-        
-        return jsonify({
-            "conversations": conversation_stats,
-            "agents": agent_stats,
+        return jsonify(_cached('stats', STATS_CACHE_TTL, lambda: {
+            "conversations": conversation_service.get_conversation_statistics(),
+            "agents": agent_service.get_agent_statistics(),
             "timestamp": datetime.utcnow().isoformat()
-        })
+        }))
     except Exception as e:
         logger.error(f"Failed to get stats: {e}")
         return jsonify({"error": "Failed to get statistics"}), 500
@@ -801,7 +585,7 @@ if __name__ == '__main__':
     logger.info(f"Database: {config.DATABASE_URL}")
     logger.info(f"Available models: {model_service.get_available_models()}")
     
-    # Start the Flask application
+    # Development server only; production runs under gunicorn (see wsgi.py)
     app.run(
         host='0.0.0.0',
         port=7860,
@@ -61,6 +61,11 @@ except Exception as e:
     logger.error(f"Failed to initialize database: {e}")
     sys.exit(1)
 
+@app.teardown_appcontext
+def remove_db_session(exception=None):
+    """Release the request thread's scoped session"""
+    db.remove_scoped_session()
+
 # Initialize services
 try:
     model_service = ModelService(config)
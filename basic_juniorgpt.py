@@ -1,21 +1,32 @@
-import requests
+import httpx
 import json
 
+# One keep-alive connection to Ollama, reused across turns
+_CLIENT = httpx.Client(base_url="http://localhost:11434", timeout=60.0)
+
 def chat_with_ollama(prompt, model="qwen2.5:7b"):
+    """Stream a reply to stdout as tokens arrive and return the full text"""
     try:
-        response = requests.post(
-            "http://localhost:11434/api/generate",
+        with _CLIENT.stream(
+            "POST",
+            "/api/generate",
             json={
                 "model": model,
                 "prompt": prompt,
-                "stream": False
-            },
-            timeout=60
-        )
-        if response.status_code == 200:
-            return response.json()['response']
-        else:
-            return f"Error: {response.status_code}"
+                "stream": True
+            }
+        ) as response:
+            if response.status_code != 200:
+                return f"Error: {response.status_code}"
+            
+            parts = []
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line).get("response", "")
+                print(chunk, end="", flush=True)
+                parts.append(chunk)
+            return "".join(parts)
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -24,15 +35,23 @@ def main():
     print("Type 'quit' to exit")
     print("-" * 50)
     
-    while True:
-        user_input = input("\nYou: ")
-        if user_input.lower() == 'quit':
-            print("Goodbye!")
-            break
+    try:
+        while True:
+            user_input = input("\nYou: ")
+            if user_input.lower() == 'quit':
+                print("Goodbye!")
+                break
             
-        print("AI: ", end="", flush=True)
-        response = chat_with_ollama(user_input)
-        print(response)
+            print("AI: ", end="", flush=True)
+            response = chat_with_ollama(user_input)
+            if response.startswith("Error: "):
+                print(response)
+            else:
+                print()
+    except KeyboardInterrupt:
+        print("\nGoodbye!")
+    finally:
+        _CLIENT.close()
 
 if __name__ == "__main__":
     main()
@@ -1,13 +1,17 @@
 """
 Configuration management for JuniorGPT
 """
+import functools
 import os
 import secrets
+import sys
 from typing import Optional
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from the project's .env file; without one, skip python-dotenv entirely
+_ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+if os.path.exists(_ENV_FILE):
+    from dotenv import load_dotenv
+    load_dotenv(_ENV_FILE)
 
 def _generate_fallback_secret_key() -> str:
     """Generate a secure fallback secret key if none is provided"""
@@ -19,7 +23,12 @@ def _generate_fallback_secret_key() -> str:
         return secrets.token_hex(32)
 
 class Config:
-    """Base configuration class"""
+    """
+    Base configuration class
+    
+    Environment variables are read and parsed once, when this module is
+    imported; settings are plain class attribute reads afterwards.
+    """
     
     # API Keys
     OPENAI_API_KEY: str = os.environ.get('OPENAI_API_KEY', '')
@@ -34,7 +43,7 @@ class Config:
     OLLAMA_TIMEOUT: int = int(os.environ.get('OLLAMA_TIMEOUT', '60'))
     
     # Flask
-    SECRET_KEY: str = os.environ.get('FLASK_SECRET_KEY', _generate_fallback_secret_key())
+    SECRET_KEY: str = os.environ.get('FLASK_SECRET_KEY') or _generate_fallback_secret_key()
     ENV: str = os.environ.get('FLASK_ENV', 'development')
     
     # Security
@@ -45,6 +54,9 @@ class Config:
     MAX_CONTEXT_LENGTH: int = int(os.environ.get('MAX_CONTEXT_LENGTH', '8192'))
     RESPONSE_TIMEOUT: int = int(os.environ.get('RESPONSE_TIMEOUT', '60'))
     MAX_CONCURRENT_REQUESTS: int = int(os.environ.get('MAX_CONCURRENT_REQUESTS', '10'))
+    RESPONSE_CACHE_TTL: int = int(os.environ.get('RESPONSE_CACHE_TTL', '86400'))  # 0 disables the cache
+    RESPONSE_CACHE_SIZE: int = int(os.environ.get('RESPONSE_CACHE_SIZE', '1024'))
+    REDIS_URL: str = os.environ.get('REDIS_URL', '')  # Shares conversation histories across workers
     
     # Features
     AUTO_DETECT_AGENTS: bool = os.environ.get('AUTO_DETECT_AGENTS', 'true').lower() == 'true'
@@ -57,26 +69,22 @@ class Config:
     @classmethod
     def validate(cls) -> bool:
         """Validate required configuration"""
-        errors = []
-        
-        if not cls.OPENAI_API_KEY:
-            errors.append("OPENAI_API_KEY is required")
-            
-        if not cls.ANTHROPIC_API_KEY:
-            errors.append("ANTHROPIC_API_KEY is required")
-            
-        if cls.SECRET_KEY == 'PRODUCTION-KEY-REQUIRED-SET-FLASK_SECRET_KEY' and cls.ENV == 'production':
-            errors.append("FLASK_SECRET_KEY must be set in production environment")
-            
-        if cls.ENV == 'production' and len(cls.SECRET_KEY) < 32:
-            errors.append("FLASK_SECRET_KEY should be at least 32 characters long in production")
-            
-        if errors:
-            for error in errors:
-                print(f"Configuration Error: {error}")
-            return False
+        secret_key = cls.SECRET_KEY
+        production = cls.ENV == 'production'
+        checks = (
+            (not cls.OPENAI_API_KEY, "OPENAI_API_KEY is required"),
+            (not cls.ANTHROPIC_API_KEY, "ANTHROPIC_API_KEY is required"),
+            (production and secret_key == 'PRODUCTION-KEY-REQUIRED-SET-FLASK_SECRET_KEY',
+             "FLASK_SECRET_KEY must be set in production environment"),
+            (production and len(secret_key) < 32,
+             "FLASK_SECRET_KEY should be at least 32 characters long in production"),
+        )
+        errors = [f"Configuration Error: {message}" for failed, message in checks if failed]
+        if not errors:
+            return True
             
-        return True
+        sys.stderr.write('\n'.join(errors) + '\n')
+        return False
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -101,9 +109,10 @@ config = {
     'default': DevelopmentConfig
 }
 
+@functools.lru_cache(maxsize=None)
 def get_config(config_name: Optional[str] = None) -> Config:
     """Get configuration based on environment"""
     if config_name is None:
-        config_name = os.environ.get('FLASK_ENV', 'development')
+        config_name = Config.ENV
     
     return config.get(config_name, config['default'])
\ No newline at end of file
@@ -5,11 +5,15 @@ Flask Secret Key Generator for JuniorGPT
 This script generates cryptographically secure secret keys for Flask applications
 using the recommended methods from the tutorials.
 """
+import re
 import secrets
-import uuid
 import os
+import tempfile
 from pathlib import Path
 
+# The FLASK_SECRET_KEY line in a .env file, without its line ending
+SECRET_KEY_LINE = re.compile(rb'^FLASK_SECRET_KEY=[^\r\n]*', re.MULTILINE)
+
 def generate_secret_key_hex(length: int = 32) -> str:
     """
     Generate a secure secret key using hexadecimal encoding.
@@ -36,12 +40,13 @@ def generate_secret_key_urlsafe(length: int = 32) -> str:
 
 def generate_secret_key_uuid() -> str:
     """
-    Generate a secret key using UUID4 (alternative method).
+    Generate a secret key in the 32-character UUID4 hex format (alternative method).
     
     Returns:
-        Hexadecimal string representation of UUID4
+        Hexadecimal string of 16 random bytes
     """
-    return uuid.uuid4().hex
+    # Same entropy source as uuid.uuid4(), without building a UUID object
+    return secrets.token_hex(16)
 
 def update_env_file(secret_key: str, env_file_path: str = ".env") -> bool:
     """
@@ -58,26 +63,27 @@ def update_env_file(secret_key: str, env_file_path: str = ".env") -> bool:
         env_path = Path(env_file_path)
         
         # Read existing .env file if it exists
-        env_content = []
-        if env_path.exists():
-            with open(env_path, 'r') as f:
-                env_content = f.readlines()
+        env_content = env_path.read_bytes() if env_path.exists() else b''
         
         # Update or add FLASK_SECRET_KEY
-        updated = False
-        for i, line in enumerate(env_content):
-            if line.startswith('FLASK_SECRET_KEY='):
-                env_content[i] = f'FLASK_SECRET_KEY={secret_key}\n'
-                updated = True
-                break
+        key_line = f'FLASK_SECRET_KEY={secret_key}'.encode('utf-8')
+        env_content, updated = SECRET_KEY_LINE.subn(lambda match: key_line, env_content, count=1)
         
         # Add FLASK_SECRET_KEY if not found
         if not updated:
-            env_content.append(f'FLASK_SECRET_KEY={secret_key}\n')
+            if env_content and not env_content.endswith(b'\n'):
+                env_content += b'\n'
+            env_content += key_line + b'\n'
         
-        # Write back to file
-        with open(env_path, 'w') as f:
-            f.writelines(env_content)
+        # Write to a temporary file beside it and swap it in, so a failed write never truncates .env
+        fd, tmp_path = tempfile.mkstemp(dir=env_path.resolve().parent, prefix='.env.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(env_content)
+            os.replace(tmp_path, env_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
         
         print(f"✅ Updated {env_file_path} with new FLASK_SECRET_KEY")
         return True
@@ -0,0 +1,29 @@
+"""
+Gunicorn settings for JuniorGPT
+
+Workers use threads rather than gevent: each worker runs its agents on a
+background asyncio loop thread, which gevent's monkey-patching would turn
+into a greenlet. Threads are cheap while they wait on LLM HTTP calls, so
+each worker keeps many requests in flight.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:7860')
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('WORKER_THREADS', 32))
+# Workers read this to decide whether in-process caches are safe; with more than one,
+# set REDIS_URL so conversation histories are shared instead of re-read from the database
+os.environ['WEB_CONCURRENCY'] = str(workers)
+
+# Agent calls can legitimately run for a while; streamed responses hold a thread throughout
+timeout = int(os.getenv('WORKER_TIMEOUT', 120))
+graceful_timeout = 30
+keepalive = 5
+
+# Not preloaded: the agent loop and health probe threads must start in each worker, after fork
+preload_app = False
+
+accesslog = '-'
+errorlog = '-'
@@ -9,21 +9,51 @@ and serves the `/process` and `/health` endpoints defined in
 from __future__ import annotations
 
 import argparse
+import copy
+import functools
 import importlib
-import json
-from typing import Optional
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from config import get_config
-from services.model_service import ModelService
-from agents.base_agent import AgentConfig
-from agents.agent_server import create_agent_app
+from utils import json_codec
 
+# Imported inside main() once arguments parse, so --help does not load the agent stack
+if TYPE_CHECKING:
+    from services.model_service import ModelService
+    from agents.base_agent import AgentConfig
+
+
+ENTRY_POINT_GROUP = "juniorgpt.agents"
+
+
+@functools.lru_cache(maxsize=None)
+def _agent_entry_points() -> Dict[str, Any]:
+    """Index the agent classes installed packages register under ENTRY_POINT_GROUP."""
+    from importlib.metadata import entry_points
+
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        group = eps.select(group=ENTRY_POINT_GROUP)
+    else:  # Python < 3.10 returns a dict of groups
+        group = eps.get(ENTRY_POINT_GROUP, ())
+    return {ep.name: ep for ep in group}
+
+
+def resolve_agent_class(agent_path: str):
+    """Resolve a registered agent name or a ``module:Class`` path to a class."""
+    entry_point = _agent_entry_points().get(agent_path)
+    if entry_point is not None:
+        return entry_point.load()
 
-def load_agent(agent_path: str, model_service: ModelService, config: Optional[AgentConfig] = None):
-    """Dynamically load and instantiate an agent class."""
     module_name, class_name = agent_path.split(":")
     module = importlib.import_module(module_name)
-    AgentClass = getattr(module, class_name)
+    return getattr(module, class_name)
+
+
+def load_agent(agent_path: str, model_service: ModelService, config: Optional[AgentConfig] = None):
+    """Dynamically load and instantiate an agent class."""
+    AgentClass = resolve_agent_class(agent_path)
 
     if config is not None:
         # Try passing config to the constructor; if not supported, set after
@@ -36,21 +66,39 @@ def load_agent(agent_path: str, model_service: ModelService, config: Optional[Ag
     return AgentClass(model_service=model_service)
 
 
-def main():
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once per process."""
     parser = argparse.ArgumentParser(description="Run an agent as a standalone service")
-    parser.add_argument("--agent", required=True, help="Python path to agent class, e.g. agents.implementations.coding_agent:CodingAgent")
+    parser.add_argument("--agent", required=True, help="Agent registered under the juniorgpt.agents entry point group, or Python path to agent class, e.g. agents.implementations.coding_agent:CodingAgent")
     parser.add_argument("--host", default="0.0.0.0")
     parser.add_argument("--port", type=int, default=8000)
     parser.add_argument("--config", help="Path to AgentConfig JSON", default=None)
-    args = parser.parse_args()
+    return parser
+
+
+@functools.lru_cache(maxsize=16)
+def _load_agent_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse an AgentConfig JSON file; keyed on mtime so edits are picked up."""
+    return json_codec.loads(Path(path).read_bytes())
+
+
+def main(argv: Optional[List[str]] = None):
+    args = _build_parser().parse_args(argv)
+
+    from config import get_config
+    from services.model_service import ModelService
+    from agents.base_agent import AgentConfig
+    from agents.agent_server import create_agent_app
 
     cfg = get_config()
     model_service = ModelService(cfg)
 
     agent_config = None
     if args.config:
-        with open(args.config, "r") as f:
-            agent_config = AgentConfig(**json.load(f))
+        config_data = _load_agent_config(args.config, os.stat(args.config).st_mtime_ns)
+        # Copied so agents cannot mutate the cached parse
+        agent_config = AgentConfig(**copy.deepcopy(config_data))
 
     agent = load_agent(args.agent, model_service, agent_config)
 
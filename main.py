@@ -1,23 +1,37 @@
-import gradio as gr
 import sqlite3
 import json
 import logging
-import requests
-from datetime import datetime
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
 import os
 
+DEFAULT_MODEL = "qwen2.5:7b"
+MODELS_CACHE_TTL = 30  # seconds
+SCHEMA_VERSION = 1
+
 class JuniorGPTAffordable:
     def __init__(self):
         self.setup_database()
         self.setup_logging()
         self.ollama_url = "http://localhost:11434"
+        self.setup_http_session()
+        
+        # Model list cache: (expires_at, models); the lock also dedupes in-flight fetches
+        self._models_cache = None
+        self._models_lock = threading.Lock()
         
     def setup_database(self):
-        """Initialize SQLite database for conversations"""
+        """Open the SQLite conversation database, creating its schema on first use"""
         os.makedirs('data', exist_ok=True)
-        conn = sqlite3.connect('data/conversations.db')
-        conn.execute('''
+        # Kept open for the life of the app; autocommit, shared by Gradio's worker threads
+        self.conn = sqlite3.connect('data/conversations.db', check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        
+        # user_version records the schema already applied, so later starts skip the DDL
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+            return
+        self.conn.execute('''
             CREATE TABLE IF NOT EXISTS conversations (
                 id INTEGER PRIMARY KEY,
                 timestamp TEXT,
@@ -27,8 +41,7 @@ class JuniorGPTAffordable:
                 response_time REAL
             )
         ''')
-        conn.commit()
-        conn.close()
+        self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
         
     def setup_logging(self):
         """Configure logging system"""
@@ -43,63 +56,127 @@ class JuniorGPTAffordable:
         )
         self.logger = logging.getLogger(__name__)
         
-    def call_ollama(self, prompt: str, model: str = "qwen2.5:7b") -> str:
-        """Call Ollama API to get response"""
+    def setup_http_session(self):
+        """Create a pooled keep-alive HTTP session for Ollama calls"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({'Connection': 'keep-alive'})
+        
+    def stream_ollama(self, prompt: str, model: str = DEFAULT_MODEL, batch_size: int = 4) -> Iterator[str]:
+        """
+        Stream a response from the Ollama API
+        
+        Args:
+            prompt: Prompt to send
+            model: Ollama model name
+            batch_size: Number of tokens to collect between yields
+            
+        Yields:
+            The response text accumulated so far
+        """
         try:
-            response = requests.post(
+            with self.session.post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": model,
                     "prompt": prompt,
-                    "stream": False
+                    "stream": True
                 },
-                timeout=60
-            )
-            if response.status_code == 200:
-                return response.json()['response']
-            else:
-                return f"Error: {response.status_code}"
+                timeout=(5, 60),
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    yield f"Error: {response.status_code}"
+                    return
+                
+                text = ""
+                pending = 0
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    text += json.loads(line).get('response', '')
+                    pending += 1
+                    # Batch tokens so the UI is not redrawn for every one
+                    if pending >= batch_size:
+                        pending = 0
+                        yield text
+                if pending or not text:
+                    yield text
         except Exception as e:
             self.logger.error(f"Ollama API error: {e}")
-            return f"Error connecting to Ollama: {str(e)}"
+            yield f"Error connecting to Ollama: {str(e)}"
         
-    def process_user_input(self, user_input: str, chat_history: List, model_choice: str) -> tuple:
-        """Main processing function for user input"""
+    def call_ollama(self, prompt: str, model: str = DEFAULT_MODEL) -> str:
+        """Call Ollama API to get response"""
+        response = ""
+        for response in self.stream_ollama(prompt, model):
+            pass
+        return response
+        
+    def process_user_input(self, user_input: str, chat_history: List, model_choice: str) -> Iterator[tuple]:
+        """Main processing function for user input, streaming the reply into the chat"""
         if not user_input.strip():
-            return chat_history, ""
+            yield chat_history, ""
+            return
             
+        # Show the message immediately and fill in the reply as it arrives
+        chat_history.append([user_input, ""])
+        start_ns = time.perf_counter_ns()
         try:
-            start_time = datetime.now()
-            
-            # Get response from Ollama
-            response = self.call_ollama(user_input, model_choice)
+            for response in self.stream_ollama(user_input, model_choice):
+                chat_history[-1][1] = response
+                yield chat_history, ""
             
-            # Update chat history
-            chat_history.append([user_input, response])
-            
-            return chat_history, ""
+            response_time = (time.perf_counter_ns() - start_ns) / 1e9
+            self.logger.info(f"Response from {model_choice} in {response_time:.2f}s")
             
         except Exception as e:
             self.logger.error(f"Error processing input: {e}")
-            error_response = f"Error: {str(e)}"
-            chat_history.append([user_input, error_response])
-            return chat_history, ""
+            chat_history[-1][1] = f"Error: {str(e)}"
+            yield chat_history, ""
             
     def get_available_models(self) -> List[str]:
-        """Get list of available Ollama models"""
+        """Get list of available Ollama models, cached for MODELS_CACHE_TTL seconds"""
+        with self._models_lock:
+            now = time.monotonic()
+            if self._models_cache and self._models_cache[0] > now:
+                return self._models_cache[1]
+            
+            models = self._fetch_available_models()
+            self._models_cache = (now + MODELS_CACHE_TTL, models)
+            return models
+        
+    def _fetch_available_models(self) -> List[str]:
+        """Query Ollama for its installed models"""
         try:
-            response = requests.get(f"{self.ollama_url}/api/tags")
+            response = self.session.get(f"{self.ollama_url}/api/tags", timeout=(5, 10))
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 return [model['name'] for model in models]
             else:
-                return ["qwen2.5:7b"]
+                return [DEFAULT_MODEL]
         except:
-            return ["qwen2.5:7b"]
+            return [DEFAULT_MODEL]
         
     def create_interface(self):
         """Create Gradio interface"""
-        available_models = self.get_available_models()
+        # Gradio loads hundreds of modules, so it is only imported when the UI is built
+        import gradio as gr
+        
+        # Fetch the model list in the background; the page fills it in once loaded
+        threading.Thread(target=self.get_available_models, daemon=True).start()
+        
+        def load_models():
+            models = self.get_available_models()
+            return (
+                gr.Dropdown(choices=models, value=models[0] if models else DEFAULT_MODEL),
+                {"status": "Ready", "models": len(models)}
+            )
         
         with gr.Blocks(title="JuniorGPT - Affordable AI Assistant") as interface:
             gr.Markdown("# 🤖 JuniorGPT - Your Personal AI Assistant")
@@ -122,8 +199,8 @@ class JuniorGPTAffordable:
                         )
                         
                         model_choice = gr.Dropdown(
-                            choices=available_models,
-                            value=available_models[0] if available_models else "qwen2.5:7b",
+                            choices=[DEFAULT_MODEL],
+                            value=DEFAULT_MODEL,
                             label="AI Model",
                             scale=1
                         )
@@ -135,7 +212,7 @@ class JuniorGPTAffordable:
                     gr.Markdown("### System Status")
                     status_display = gr.JSON(
                         label="System Info",
-                        value={"status": "Ready", "models": len(available_models)}
+                        value={"status": "Loading models..."}
                     )
             
             # Event handlers
@@ -151,6 +228,11 @@ class JuniorGPTAffordable:
                 outputs=[chatbot, user_input]
             )
             
+            interface.load(
+                fn=load_models,
+                outputs=[model_choice, status_display]
+            )
+            
             clear_btn.click(
                 fn=lambda: ([], ""),
                 outputs=[chatbot, user_input]
@@ -6,6 +6,7 @@ import sqlite3
 import json
 import sys
 import os
+from pathlib import Path
 from datetime import datetime
 import logging
 
@@ -14,8 +15,15 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import get_config
 from models import init_db, Conversation, Agent
+from utils import json_codec
 from utils.logging_config import setup_logging
 
+try:
+    from ciso8601 import parse_datetime as parse_timestamp
+except ImportError:  # Optional; fall back to the standard library parser
+    def parse_timestamp(timestamp: str) -> datetime:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
 def migrate_database():
     """Migrate existing database to new schema"""
     
@@ -52,8 +60,7 @@ def migrate_database():
         
         # Connect to old database
         logger.info("Reading data from old database...")
-        old_conn = sqlite3.connect(old_db_path)
-        old_conn.row_factory = sqlite3.Row  # Enable column access by name
+        old_conn = open_source_database(old_db_path)
         
         # Migrate conversations
         migrate_conversations(old_conn, db, logger)
@@ -67,12 +74,24 @@ def migrate_database():
         logger.error(f"Migration failed: {e}")
         return False
 
-def migrate_conversations(old_conn, db, logger):
+def open_source_database(path: str) -> sqlite3.Connection:
+    """Open the old database read-only, tuned for one sequential scan"""
+    conn = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+    conn.execute("PRAGMA cache_size=-65536")  # 64MB
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+def migrate_conversations(old_conn, db, logger, batch_size: int = 1000):
     """Migrate conversation data"""
     
     try:
         # Get old conversations
         cursor = old_conn.cursor()
+        total = cursor.execute("SELECT COUNT(*) FROM conversations").fetchone()[0]
+        logger.info(f"Found {total} conversations to migrate")
+        
         cursor.execute("""
             SELECT id, conversation_id, timestamp, user_input, agent_response, 
                    agents_used, thinking_trace, satisfaction_rating
@@ -80,66 +99,22 @@ def migrate_conversations(old_conn, db, logger):
             ORDER BY timestamp
         """)
         
-        old_conversations = cursor.fetchall()
-        logger.info(f"Found {len(old_conversations)} conversations to migrate")
-        
         migrated_count = 0
+        # Stands in for missing or unparseable timestamps
+        migrated_at = datetime.utcnow()
         
         with db.get_session() as session:
-            for old_conv in old_conversations:
-                try:
-                    # Parse JSON fields safely
-                    agents_used = []
-                    thinking_trace = {}
-                    
-                    if old_conv['agents_used']:
-                        try:
-                            agents_used = json.loads(old_conv['agents_used'])
-                        except (json.JSONDecodeError, TypeError):
-                            agents_used = []
-                    
-                    if old_conv['thinking_trace']:
-                        try:
-                            thinking_trace = json.loads(old_conv['thinking_trace'])
-                        except (json.JSONDecodeError, TypeError):
-                            thinking_trace = {}
-                    
-                    # Parse timestamp
-                    timestamp = old_conv['timestamp']
-                    if timestamp:
-                        try:
-                            created_at = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        except:
-                            created_at = datetime.utcnow()
-                    else:
-                        created_at = datetime.utcnow()
-                    
-                    # Create new conversation
-                    new_conversation = Conversation(
-                        user_input=old_conv['user_input'] or '',
-                        agent_response=old_conv['agent_response'] or '',
-                        conversation_id=old_conv['conversation_id'] or f"migrated_{old_conv['id']}",
-                        agents_used=agents_used,
-                        thinking_trace=thinking_trace,
-                        satisfaction_rating=old_conv['satisfaction_rating']
-                    )
-                    
-                    # Set the timestamp manually
-                    new_conversation.created_at = created_at
-                    new_conversation.updated_at = created_at
-                    
-                    session.add(new_conversation)
-                    migrated_count += 1
-                    
-                    if migrated_count % 100 == 0:
-                        logger.info(f"Migrated {migrated_count} conversations...")
-                        session.commit()  # Commit in batches
+            # Read and insert in batches to bound memory and skip per-object ORM bookkeeping
+            while True:
+                old_conversations = cursor.fetchmany(batch_size)
+                if not old_conversations:
+                    break
                 
-                except Exception as e:
-                    logger.warning(f"Failed to migrate conversation {old_conv['id']}: {e}")
-                    continue
-            
-            session.commit()
+                mappings = list(_conversation_mappings(old_conversations, migrated_at, logger))
+                session.bulk_insert_mappings(Conversation, mappings)
+                session.commit()
+                migrated_count += len(mappings)
+                logger.info(f"Migrated {migrated_count} conversations...")
         
         logger.info(f"Successfully migrated {migrated_count} conversations")
         
@@ -147,6 +122,48 @@ def migrate_conversations(old_conn, db, logger):
         logger.error(f"Failed to migrate conversations: {e}")
         raise
 
+def _safe_loads(value, default):
+    """Parse a JSON field, or return default if it is empty or invalid"""
+    if not value:
+        return default
+    try:
+        return json_codec.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return default
+
+def _conversation_mappings(old_conversations, fallback_time: datetime, logger):
+    """Yield new-schema column values for old conversation rows, in a single pass"""
+    generate_title = Conversation._generate_title
+    for old_conv in old_conversations:
+        try:
+            # Parse timestamp
+            timestamp = old_conv['timestamp']
+            created_at = fallback_time
+            if timestamp:
+                try:
+                    created_at = parse_timestamp(timestamp)
+                except:
+                    pass
+            
+            # Bulk inserts bypass Conversation.__init__, so apply its defaults here
+            user_input = old_conv['user_input'] or ''
+            yield {
+                'user_input': user_input,
+                'agent_response': old_conv['agent_response'] or '',
+                'conversation_id': old_conv['conversation_id'] or f"migrated_{old_conv['id']}",
+                'agents_used': _safe_loads(old_conv['agents_used'], []),
+                'thinking_trace': _safe_loads(old_conv['thinking_trace'], {}),
+                'satisfaction_rating': old_conv['satisfaction_rating'],
+                'model_used': '',
+                'response_time': 0.0,
+                'title': generate_title(user_input),
+                'tags': [],
+                'created_at': created_at,
+                'updated_at': created_at
+            }
+        except Exception as e:
+            logger.warning(f"Failed to migrate conversation {old_conv['id']}: {e}")
+
 def create_sample_data():
     """Create some sample data for testing"""
     
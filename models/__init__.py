@@ -1,9 +1,28 @@
 """
 Database models for JuniorGPT
 """
+import importlib
+
 from .database import db, init_db
-from .conversation import Conversation
-from .agent import Agent, AgentExecution
-from .team import Team
 
-__all__ = ['db', 'init_db', 'Conversation', 'Agent', 'AgentExecution', 'Team']
\ No newline at end of file
+# Model classes are imported on first access (PEP 562); init_db imports them all
+_LAZY_MODELS = {
+    'Conversation': '.conversation',
+    'ConversationTurn': '.conversation',
+    'Agent': '.agent',
+    'AgentExecution': '.agent',
+    'Team': '.team',
+}
+
+def __getattr__(name):
+    module_name = _LAZY_MODELS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODELS))
+
+__all__ = ('db', 'init_db', 'Conversation', 'ConversationTurn', 'Agent', 'AgentExecution', 'Team')
\ No newline at end of file
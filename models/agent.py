@@ -1,8 +1,8 @@
 """
 Agent models for tracking agent configurations and executions
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, JSON, Index, update
+from sqlalchemy.orm import relationship, selectinload
 from sqlalchemy.sql import func
 from datetime import datetime
 from typing import List, Optional, Dict, Any
@@ -14,6 +14,10 @@ class Agent(Base):
     """Model for storing agent configurations"""
     
     __tablename__ = 'agents'
+    __table_args__ = (
+        # Active-agent filter plus the top-performers sort
+        Index('ix_agent_active_perf', 'is_active', 'success_rate', 'total_executions'),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -35,8 +39,10 @@ class Agent(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
     
-    # Performance tracking
+    # Performance tracking: raw counters, plus derived averages kept for sorting and indexing
     total_executions = Column(Integer, default=0)
+    successful_executions = Column(Integer, default=0)
+    total_response_time = Column(Float, default=0.0)
     average_response_time = Column(Float, default=0.0)
     success_rate = Column(Float, default=0.0)
     
@@ -74,6 +80,7 @@ class Agent(Base):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'total_executions': self.total_executions,
+            'successful_executions': self.successful_executions,
             'average_response_time': self.average_response_time,
             'success_rate': self.success_rate,
             'max_tokens': self.max_tokens,
@@ -83,26 +90,53 @@ class Agent(Base):
     
     def update_performance(self, response_time: float, success: bool):
         """Update agent performance metrics"""
-        # Update execution count
-        self.total_executions += 1
+        executions = self.total_executions or 0
         
-        # Update average response time
-        if self.average_response_time == 0:
-            self.average_response_time = response_time
-        else:
-            # Moving average
-            self.average_response_time = (
-                (self.average_response_time * (self.total_executions - 1) + response_time) 
-                / self.total_executions
-            )
+        # Rows saved before the counters existed: recover them from the stored averages
+        if self.successful_executions is None:
+            self.successful_executions = round((self.success_rate or 0.0) * executions / 100)
+        if self.total_response_time is None:
+            self.total_response_time = (self.average_response_time or 0.0) * executions
         
-        # Update success rate
+        # Update counters
+        self.total_executions = executions + 1
+        self.total_response_time += response_time
         if success:
-            successful_executions = int(self.success_rate * (self.total_executions - 1) / 100) + 1
-        else:
-            successful_executions = int(self.success_rate * (self.total_executions - 1) / 100)
-            
-        self.success_rate = (successful_executions / self.total_executions) * 100
+            self.successful_executions += 1
+        
+        # Derive averages from the counters, so they never drift
+        self.average_response_time = self.total_response_time / self.total_executions
+        self.success_rate = (self.successful_executions / self.total_executions) * 100
+    
+    @classmethod
+    def record_execution(cls, session, agent_pk: int, response_time: float, success: bool):
+        """Record an execution with one atomic UPDATE, so concurrent executions never lose increments"""
+        previous_executions = func.coalesce(cls.total_executions, 0)
+        
+        # NULL counters are recovered from the stored averages, as in update_performance
+        previous_successful = func.coalesce(
+            cls.successful_executions,
+            func.round(func.coalesce(cls.success_rate, 0) * previous_executions / 100)
+        )
+        previous_response_time_sum = func.coalesce(
+            cls.total_response_time,
+            func.coalesce(cls.average_response_time, 0) * previous_executions
+        )
+        
+        executions = previous_executions + 1
+        response_time_sum = previous_response_time_sum + response_time
+        successful = previous_successful + (1 if success else 0)
+        
+        # Derived columns come first: MySQL reads already-assigned columns in later assignments
+        session.execute(
+            update(cls).where(cls.id == agent_pk).ordered_values(
+                (cls.average_response_time, response_time_sum / executions),
+                (cls.success_rate, successful * 100.0 / executions),
+                (cls.total_executions, executions),
+                (cls.total_response_time, response_time_sum),
+                (cls.successful_executions, successful)
+            ).execution_options(synchronize_session=False)
+        )
     
     def activate(self):
         """Activate the agent"""
@@ -125,63 +159,60 @@ class Agent(Base):
     @classmethod
     def get_performance_stats(cls, session) -> Dict[str, Any]:
         """Get agent performance statistics"""
-        agents = session.query(cls).filter_by(is_active=True).all()
+        active = cls.is_active == True
+        
+        # Totals and averages in a single aggregate query
+        total_agents, total_executions, total_response_time, average_success_rate = session.query(
+            func.count(cls.id),
+            func.sum(cls.total_executions),
+            func.sum(cls.average_response_time * cls.total_executions),
+            func.avg(cls.success_rate)
+        ).filter(active).one()
+        total_executions = total_executions or 0
         
         stats = {
-            'total_agents': len(agents),
-            'total_executions': sum(agent.total_executions for agent in agents),
+            'total_agents': total_agents,
+            'total_executions': total_executions,
             'average_response_time': 0.0,
             'average_success_rate': 0.0,
             'top_performers': [],
             'model_usage': {}
         }
         
-        if agents:
-            # Calculate averages
-            total_response_time = sum(
-                agent.average_response_time * agent.total_executions 
-                for agent in agents if agent.total_executions > 0
-            )
-            total_executions = sum(agent.total_executions for agent in agents)
-            
+        if total_agents:
             if total_executions > 0:
-                stats['average_response_time'] = total_response_time / total_executions
-                
-            stats['average_success_rate'] = sum(
-                agent.success_rate for agent in agents
-            ) / len(agents)
+                stats['average_response_time'] = (total_response_time or 0.0) / total_executions
+            stats['average_success_rate'] = average_success_rate or 0.0
             
             # Top performers (by success rate and execution count)
-            top_performers = sorted(
-                agents,
-                key=lambda a: (a.success_rate, a.total_executions),
-                reverse=True
-            )[:5]
+            top_performers = session.query(
+                cls.name, cls.success_rate, cls.total_executions, cls.average_response_time
+            ).filter(active).order_by(
+                cls.success_rate.desc(), cls.total_executions.desc()
+            ).limit(5).all()
             
             stats['top_performers'] = [
                 {
-                    'name': agent.name,
-                    'success_rate': agent.success_rate,
-                    'total_executions': agent.total_executions,
-                    'average_response_time': agent.average_response_time
+                    'name': name,
+                    'success_rate': success_rate,
+                    'total_executions': executions,
+                    'average_response_time': response_time
                 }
-                for agent in top_performers
+                for name, success_rate, executions, response_time in top_performers
             ]
             
             # Model usage statistics
-            model_usage = {}
-            for agent in agents:
-                model = agent.model
-                if model in model_usage:
-                    model_usage[model]['count'] += 1
-                    model_usage[model]['executions'] += agent.total_executions
-                else:
-                    model_usage[model] = {
-                        'count': 1,
-                        'executions': agent.total_executions
-                    }
+            model_usage = session.query(
+                cls.model, func.count(cls.id), func.sum(cls.total_executions)
+            ).filter(active).group_by(cls.model).all()
             
-            stats['model_usage'] = model_usage
+            stats['model_usage'] = {
+                model: {
+                    'count': count,
+                    'executions': executions or 0
+                }
+                for model, count, executions in model_usage
+            }
         
         return stats
     
@@ -192,6 +223,10 @@ class AgentExecution(Base):
     """Model for tracking individual agent executions"""
     
     __tablename__ = 'agent_executions'
+    __table_args__ = (
+        Index('ix_exec_conv_started', 'conversation_id', 'started_at'),
+        Index('ix_exec_started', 'started_at'),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -238,6 +273,26 @@ class AgentExecution(Base):
         self.thinking_trace = thinking_trace or {}
         self.status = 'completed'
     
+    @classmethod
+    def bulk_mark_completed(cls, session, rows: List[Dict[str, Any]]):
+        """
+        Mark many executions completed with one executemany UPDATE
+        
+        Each row needs the execution 'id' and 'response_time'; 'tokens_used',
+        'thinking_trace' and 'completed_at' default as in mark_completed.
+        """
+        completed_at = datetime.utcnow()
+        session.bulk_update_mappings(cls, [
+            {
+                **row,
+                'completed_at': row.get('completed_at') or completed_at,
+                'tokens_used': row.get('tokens_used') or 0,
+                'thinking_trace': row.get('thinking_trace') or {},
+                'status': 'completed'
+            }
+            for row in rows
+        ])
+    
     def mark_failed(self, error_message: str):
         """Mark execution as failed"""
         self.completed_at = datetime.utcnow()
@@ -269,13 +324,17 @@ class AgentExecution(Base):
     
     @classmethod
     def get_recent_executions(cls, session, limit: int = 50) -> List['AgentExecution']:
-        """Get recent executions"""
-        return session.query(cls).order_by(cls.started_at.desc()).limit(limit).all()
+        """Get recent executions, with their agents loaded in one extra query"""
+        return session.query(cls).options(selectinload(cls.agent)).order_by(
+            cls.started_at.desc()
+        ).limit(limit).all()
     
     @classmethod
     def get_executions_for_conversation(cls, session, conversation_id: int) -> List['AgentExecution']:
-        """Get all executions for a conversation"""
-        return session.query(cls).filter_by(conversation_id=conversation_id).order_by(cls.started_at).all()
+        """Get all executions for a conversation, with their agents loaded in one extra query"""
+        return session.query(cls).options(selectinload(cls.agent)).filter_by(
+            conversation_id=conversation_id
+        ).order_by(cls.started_at).all()
     
     def __repr__(self):
         return f"<AgentExecution(id={self.id}, agent_id={self.agent_id}, status={self.status})>"
\ No newline at end of file
@@ -1,18 +1,39 @@
 """
 Conversation model for storing chat history
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, JSON, Index, case, event, literal_column, select, text, true, type_coerce
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from typing import Dict, Any, List, Optional
+from collections import Counter
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+import logging
 import uuid
 
 from .database import Base
 
+logger = logging.getLogger('juniorgpt.conversation')
+
+# Indexable binary JSON on PostgreSQL, plain JSON elsewhere
+JSONVariant = JSON().with_variant(JSONB(), 'postgresql')
+
+class ConversationTurn(NamedTuple):
+    """Read-only user/agent exchange, selected by column without loading ORM objects"""
+    user_input: str
+    agent_response: str
+
 class Conversation(Base):
     """Model for storing conversation data"""
     
     __tablename__ = 'conversations'
+    __table_args__ = (
+        # Recent conversations: is_archived filter, newest first
+        Index('ix_conv_archived_created', 'is_archived', 'created_at'),
+        # Tag and agent containment lookups (PostgreSQL only)
+        Index('ix_conv_tags_gin', 'tags', postgresql_using='gin').ddl_if(dialect='postgresql'),
+        Index('ix_conv_agents_gin', 'agents_used', postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -31,12 +52,12 @@ class Conversation(Base):
     agent_response = Column(Text, nullable=False)
     
     # Metadata
-    agents_used = Column(JSON)  # List of agent names that participated
+    agents_used = Column(JSONVariant)  # List of agent names that participated
     model_used = Column(String(100))  # Primary model used
     response_time = Column(Float)  # Response time in seconds
     
     # Thinking trace data
-    thinking_trace = Column(JSON)  # Raw thinking trace data
+    thinking_trace = Column(JSONVariant)  # Raw thinking trace data
     
     # User feedback
     satisfaction_rating = Column(Integer)  # 1-5 rating
@@ -45,23 +66,25 @@ class Conversation(Base):
     # Conversation metadata
     title = Column(String(200))  # Auto-generated or user-set title
     is_archived = Column(Boolean, default=False)
-    tags = Column(JSON)  # User-defined tags
+    tags = Column(JSONVariant)  # User-defined tags
     
     # Relationships
     executions = relationship("AgentExecution", back_populates="conversation", cascade="all, delete-orphan")
     
     def __init__(self, user_input: str, agent_response: str, **kwargs):
-        self.conversation_id = kwargs.get('conversation_id', str(uuid.uuid4()))
+        # Defaults are only computed when the keyword is absent
+        self.conversation_id = kwargs['conversation_id'] if 'conversation_id' in kwargs else str(uuid.uuid4())
         self.user_input = user_input
         self.agent_response = agent_response
         self.agents_used = kwargs.get('agents_used', [])
         self.model_used = kwargs.get('model_used', '')
         self.response_time = kwargs.get('response_time', 0.0)
         self.thinking_trace = kwargs.get('thinking_trace', {})
-        self.title = kwargs.get('title', self._generate_title(user_input))
+        self.title = kwargs['title'] if 'title' in kwargs else self._generate_title(user_input)
         self.tags = kwargs.get('tags', [])
         
-    def _generate_title(self, user_input: str) -> str:
+    @staticmethod
+    def _generate_title(user_input: str) -> str:
         """Generate a conversation title from user input"""
         # Take first 50 characters and clean up
         title = user_input[:50].strip()
@@ -133,7 +156,28 @@ class Conversation(Base):
     
     @classmethod
     def search_conversations(cls, session, query_text: str, limit: int = 20) -> List['Conversation']:
-        """Search conversations by text content"""
+        """Search conversations by text content, through the full-text index where there is one"""
+        dialect = session.get_bind().dialect.name
+        terms = query_text.split()
+        
+        if terms and dialect == 'sqlite':
+            # Every word, as a quoted prefix so FTS5 query syntax in the input is taken literally
+            match = " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+            matching_ids = select(literal_column('rowid')).select_from(text('conversations_fts')).where(
+                text('conversations_fts MATCH :match').bindparams(match=match)
+            )
+            try:
+                return session.query(cls).filter(
+                    cls.id.in_(matching_ids)
+                ).order_by(cls.created_at.desc()).limit(limit).all()
+            except OperationalError as e:
+                # SQLite built without FTS5
+                logger.warning(f"Full-text search unavailable, scanning conversations: {e}")
+        elif terms and dialect == 'postgresql':
+            return session.query(cls).filter(
+                _search_document(cls).op('@@')(func.plainto_tsquery(text("'english'"), query_text))
+            ).order_by(cls.created_at.desc()).limit(limit).all()
+        
         search_filter = f"%{query_text}%"
         return session.query(cls).filter(
             (cls.user_input.ilike(search_filter)) |
@@ -144,43 +188,125 @@ class Conversation(Base):
     @classmethod
     def get_conversations_by_tag(cls, session, tag: str, limit: int = 20) -> List['Conversation']:
         """Get conversations by tag"""
+        if session.get_bind().dialect.name == 'postgresql':
+            # JSONB containment (@>), served by the GIN index
+            tag_filter = type_coerce(cls.tags, JSONB).contains([tag])
+        else:
+            tag_filter = cls.tags.contains([tag])
+        
         return session.query(cls).filter(
-            cls.tags.contains([tag])
+            tag_filter
         ).order_by(cls.created_at.desc()).limit(limit).all()
     
     @classmethod
     def get_conversation_stats(cls, session) -> Dict[str, Any]:
         """Get conversation statistics"""
-        total_conversations = session.query(cls).count()
-        archived_count = session.query(cls).filter_by(is_archived=True).count()
-        
-        # Average response time
-        avg_response_time = session.query(func.avg(cls.response_time)).scalar() or 0.0
-        
-        # Most used agents
-        agent_usage = {}
-        conversations_with_agents = session.query(cls).filter(cls.agents_used.isnot(None)).all()
-        
-        for conv in conversations_with_agents:
-            for agent in (conv.agents_used or []):
-                agent_usage[agent] = agent_usage.get(agent, 0) + 1
-        
-        # Satisfaction ratings
-        ratings = session.query(cls.satisfaction_rating).filter(
-            cls.satisfaction_rating.isnot(None)
-        ).all()
-        
-        avg_rating = sum(r[0] for r in ratings) / len(ratings) if ratings else 0.0
+        # Counts and averages in a single scan
+        total_conversations, archived_count, avg_response_time, avg_rating, total_ratings = session.query(
+            func.count(cls.id),
+            func.sum(case((cls.is_archived == True, 1), else_=0)),
+            func.avg(cls.response_time),
+            func.avg(cls.satisfaction_rating),
+            func.count(cls.satisfaction_rating)
+        ).one()
+        archived_count = archived_count or 0
         
         return {
             'total_conversations': total_conversations,
             'active_conversations': total_conversations - archived_count,
             'archived_conversations': archived_count,
-            'average_response_time': round(avg_response_time, 2),
-            'most_used_agents': sorted(agent_usage.items(), key=lambda x: x[1], reverse=True)[:5],
-            'average_satisfaction_rating': round(avg_rating, 2),
-            'total_ratings': len(ratings)
+            'average_response_time': round(avg_response_time or 0.0, 2),
+            'most_used_agents': cls._most_used_agents(session),
+            'average_satisfaction_rating': round(float(avg_rating or 0.0), 2),
+            'total_ratings': total_ratings
         }
     
+    @classmethod
+    def _most_used_agents(cls, session, limit: int = 5) -> List[Tuple[str, int]]:
+        """Count how many conversations each agent took part in"""
+        if session.get_bind().dialect.name == 'sqlite':
+            # Unnest agents_used with json_each and tally in the database
+            agent = func.json_each(cls.agents_used).table_valued('value').alias('agent')
+            uses = func.count().label('uses')
+            rows = session.execute(
+                select(agent.c.value, uses)
+                .select_from(cls)
+                .join(agent, true())
+                .where(agent.c.value.isnot(None))
+                .group_by(agent.c.value)
+                .order_by(uses.desc())
+                .limit(limit)
+            ).all()
+            return [(name, count) for name, count in rows]
+        
+        # Other databases: fetch only the JSON column, not whole conversations
+        agent_usage = Counter()
+        for agents_used in session.execute(
+            select(cls.agents_used).where(cls.agents_used.isnot(None))
+        ).scalars():
+            agent_usage.update(agents_used or [])
+        return agent_usage.most_common(limit)
+    
     def __repr__(self):
-        return f"<Conversation(id={self.id}, conversation_id={self.conversation_id}, title='{self.title}')>"
\ No newline at end of file
+        return f"<Conversation(id={self.id}, conversation_id={self.conversation_id}, title='{self.title}')>"
+
+def _search_document(conversation):
+    """PostgreSQL tsvector of the searchable text; must match ix_conv_search_tsv to use it"""
+    # Inline constants, so the query expression is identical to the indexed one
+    space = text("' '")
+    return func.to_tsvector(
+        text("'english'"),
+        conversation.user_input + space + conversation.agent_response + space
+        + func.coalesce(conversation.title, text("''"))
+    )
+
+Index('ix_conv_search_tsv', _search_document(Conversation), postgresql_using='gin').ddl_if(dialect='postgresql')
+
+# SQLite full-text index: an external-content FTS5 table kept in sync by triggers
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE conversations_fts USING fts5("
+    "user_input, agent_response, title, content='conversations', content_rowid='id')",
+    "CREATE TRIGGER conversations_fts_ai AFTER INSERT ON conversations BEGIN "
+    "INSERT INTO conversations_fts(rowid, user_input, agent_response, title) "
+    "VALUES (new.id, new.user_input, new.agent_response, new.title); END",
+    "CREATE TRIGGER conversations_fts_ad AFTER DELETE ON conversations BEGIN "
+    "INSERT INTO conversations_fts(conversations_fts, rowid, user_input, agent_response, title) "
+    "VALUES ('delete', old.id, old.user_input, old.agent_response, old.title); END",
+    "CREATE TRIGGER conversations_fts_au AFTER UPDATE OF user_input, agent_response, title ON conversations BEGIN "
+    "INSERT INTO conversations_fts(conversations_fts, rowid, user_input, agent_response, title) "
+    "VALUES ('delete', old.id, old.user_input, old.agent_response, old.title); "
+    "INSERT INTO conversations_fts(rowid, user_input, agent_response, title) "
+    "VALUES (new.id, new.user_input, new.agent_response, new.title); END",
+    # Index conversations stored before the table existed
+    "INSERT INTO conversations_fts(conversations_fts) VALUES ('rebuild')",
+)
+
+def _create_sqlite_fts(metadata, connection, **kwargs):
+    """Create the FTS5 index on SQLite databases that do not have it yet"""
+    if connection.dialect.name != 'sqlite':
+        return
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'conversations_fts'"
+    ).first()
+    if exists:
+        return
+    
+    # Legacy tables (see migrate.py) lack the indexed columns; triggers on them would break every insert
+    columns = {row[1] for row in connection.exec_driver_sql("PRAGMA table_info(conversations)")}
+    missing = {'user_input', 'agent_response', 'title'} - columns
+    if missing:
+        logger.warning(f"Not creating conversations_fts: conversations has no {', '.join(sorted(missing))}")
+        return
+    try:
+        for statement in SQLITE_FTS_DDL:
+            connection.exec_driver_sql(statement)
+    except OperationalError as e:
+        logger.warning(f"SQLite full-text search unavailable: {e}")
+
+def _drop_sqlite_fts(metadata, connection, **kwargs):
+    """Drop the FTS5 index with the tables it mirrors"""
+    if connection.dialect.name == 'sqlite':
+        connection.exec_driver_sql("DROP TABLE IF EXISTS conversations_fts")
+
+event.listen(Base.metadata, 'after_create', _create_sqlite_fts)
+event.listen(Base.metadata, 'before_drop', _drop_sqlite_fts)
@@ -2,23 +2,59 @@
 Database configuration and initialization
 """
 import os
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, event, inspect, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
 import logging
 
+from utils import json_codec
+
 logger = logging.getLogger('juniorgpt.database')
 
 # Create declarative base
 Base = declarative_base()
 
+SQLITE_PRAGMAS = (
+    # Write-ahead logging, so writes skip most fsyncs and readers are not blocked
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    # Read through a 256 MiB memory map and a 64 MiB page cache
+    "mmap_size=268435456",
+    "cache_size=-65536",
+    "temp_store=MEMORY",
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection for the app's write-heavy workload"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+# Columns added to existing tables after release: (table, column, type, backfill expression)
+ADDED_COLUMNS = (
+    ('agents', 'successful_executions', 'INTEGER',
+     'CAST(ROUND(COALESCE(success_rate, 0) * COALESCE(total_executions, 0) / 100) AS INTEGER)'),
+    ('agents', 'total_response_time', 'FLOAT',
+     'COALESCE(average_response_time, 0) * COALESCE(total_executions, 0)'),
+)
+
+# Indexes added to existing tables after release: (table, index name)
+ADDED_INDEXES = (
+    ('conversations', 'ix_conv_archived_created'),
+    ('agent_executions', 'ix_exec_conv_started'),
+    ('agent_executions', 'ix_exec_started'),
+    ('agents', 'ix_agent_active_perf'),
+)
+
 class Database:
     """Database manager class"""
     
     def __init__(self):
         self.engine = None
+        self._session_factory = None
         self.Session = None
         self.session = None
         
@@ -37,6 +73,8 @@ class Database:
                 self.engine = create_engine(
                     database_url,
                     echo=echo,
+                    json_serializer=json_codec.dumps,
+                    json_deserializer=json_codec.loads,
                     poolclass=StaticPool,
                     connect_args={
                         'check_same_thread': False,
@@ -44,19 +82,23 @@ class Database:
                     },
                     pool_pre_ping=True
                 )
+                event.listen(self.engine, 'connect', _set_sqlite_pragmas)
             else:
                 # PostgreSQL/MySQL configuration
                 self.engine = create_engine(
                     database_url,
                     echo=echo,
+                    json_serializer=json_codec.dumps,
+                    json_deserializer=json_codec.loads,
                     pool_size=10,
                     max_overflow=20,
                     pool_pre_ping=True,
                     pool_recycle=3600
                 )
             
-            # Create session factory
-            self.Session = scoped_session(sessionmaker(bind=self.engine))
+            # Create session factory; the thread-local registry is only for request-scoped use
+            self._session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
+            self.Session = scoped_session(self._session_factory)
             
             logger.info(f"Database initialized: {database_url}")
             
@@ -73,6 +115,31 @@ class Database:
             logger.error(f"Failed to create database tables: {e}")
             raise
     
+    def upgrade_schema(self):
+        """Add and backfill columns, and create indexes, missing from databases created by older versions"""
+        inspector = inspect(self.engine)
+        existing = {
+            table: {column['name'] for column in inspector.get_columns(table)}
+            for table in {table for table, _, _, _ in ADDED_COLUMNS} | {table for table, _ in ADDED_INDEXES}
+        }
+        
+        with self.engine.begin() as connection:
+            for table, column, column_type, backfill in ADDED_COLUMNS:
+                if column in existing[table]:
+                    continue
+                connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+                connection.exec_driver_sql(f"UPDATE {table} SET {column} = {backfill}")
+                logger.info(f"Added column {table}.{column}")
+        
+        for table, index_name in ADDED_INDEXES:
+            index = next(index for index in Base.metadata.tables[table].indexes if index.name == index_name)
+            missing = {column.name for column in index.columns} - existing[table]
+            if missing:
+                # Legacy tables (see migrate.py) are left alone
+                logger.warning(f"Not creating index {index_name}: {table} has no {', '.join(sorted(missing))}")
+                continue
+            index.create(self.engine, checkfirst=True)
+    
     def drop_all(self):
         """Drop all tables (use with caution!)"""
         try:
@@ -84,8 +151,8 @@ class Database:
     
     @contextmanager
     def get_session(self):
-        """Get database session with automatic cleanup"""
-        session = self.Session()
+        """Get a fresh database session with automatic cleanup"""
+        session = self._session_factory()
         try:
             yield session
             session.commit()
@@ -97,9 +164,14 @@ class Database:
             session.close()
     
     def get_scoped_session(self):
-        """Get scoped session for thread-safe operations"""
+        """Get the current thread's scoped session; call remove_scoped_session when done"""
         return self.Session()
     
+    def remove_scoped_session(self):
+        """Close and discard the current thread's scoped session"""
+        if self.Session:
+            self.Session.remove()
+    
     def close(self):
         """Close database connections"""
         if self.Session:
@@ -118,7 +190,8 @@ def init_db(database_url: str, echo: bool = False):
     # Import all models to ensure they're registered
     from . import conversation, agent, team
     
-    # Create tables
+    # Create tables, then bring tables from older versions up to date
     db.create_all()
+    db.upgrade_schema()
     
     return db
\ No newline at end of file
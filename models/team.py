@@ -21,7 +21,7 @@ class Team(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
 
     def __init__(self, name: str, agents: List[str], **kwargs):
-        self.team_id = kwargs.get('team_id', str(uuid.uuid4()))
+        self.team_id = kwargs['team_id'] if 'team_id' in kwargs else str(uuid.uuid4())
         self.name = name
         self.description = kwargs.get('description', '')
         self.agents = agents
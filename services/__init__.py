@@ -5,5 +5,6 @@ from .agent_service import AgentService
 from .model_service import ModelService
 from .conversation_service import ConversationService
 from .team_service import TeamService
+from .response_cache import ResponseCache
 
-__all__ = ['AgentService', 'ModelService', 'ConversationService', 'TeamService']
\ No newline at end of file
+__all__ = ['AgentService', 'ModelService', 'ConversationService', 'TeamService', 'ResponseCache']
\ No newline at end of file
@@ -4,7 +4,7 @@ Agent service for managing AI agents and their execution
 import asyncio
 import time
 import re
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple, Any
 import logging
 from datetime import datetime
 import httpx
@@ -113,11 +113,34 @@ class AgentService:
         conversation_history: Optional[List[Dict]] = None
     ) -> Dict[str, Any]:
         """Process message with specified agents"""
+        result = None
+        async for event in self.stream_with_agents(message, agent_ids, conversation_id, conversation_history):
+            if event["type"] == "result":
+                result = event
+        
+        result.pop("type")
+        return result
+    
+    async def stream_with_agents(
+        self,
+        message: str,
+        agent_ids: List[str],
+        conversation_id: Optional[str] = None,
+        conversation_history: Optional[List[Dict]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process message with specified agents, yielding each agent's output as it finishes
+        
+        Yields:
+            One {"type": "agent", ...} event per agent in completion order, then a
+            final {"type": "result", ...} event with the process_with_agents result
+        """
         
         # Validate input
         is_valid, error_msg = self.security.validate_message_input(message)
         if not is_valid:
-            return {
+            yield {
+                "type": "result",
                 "success": False,
                 "error": error_msg,
                 "response": f"Input validation failed: {error_msg}",
@@ -125,11 +148,14 @@ class AgentService:
                 "thinking_traces": {},
                 "response_time": 0.0
             }
+            return
         
         start_time = time.time()
         thinking_traces = {}
         agent_responses = {}
         execution_ids = []
+        completions = []
+        tasks = []
         
         try:
             # Get conversation from database
@@ -139,18 +165,14 @@ class AgentService:
                     conversation = Conversation.get_by_conversation_id(session, conversation_id)
             
             # Process with each agent concurrently
-            tasks = []
-            for agent_id in agent_ids:
-                task = self._execute_agent(agent_id, message, conversation_history, conversation)
-                tasks.append(task)
-            
-            # Wait for all agents to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [
+                asyncio.ensure_future(self._execute_agent_tagged(agent_id, message, conversation_history, conversation))
+                for agent_id in agent_ids
+            ]
             
-            # Process results
-            successful_agents = []
-            for i, result in enumerate(results):
-                agent_id = agent_ids[i]
+            # Report each agent as soon as it completes
+            for next_done in asyncio.as_completed(tasks):
+                agent_id, result = await next_done
                 
                 if isinstance(result, Exception):
                     logger.error(f"Agent {agent_id} failed: {result}")
@@ -159,16 +181,21 @@ class AgentService:
                         "thinking": f"Error: {str(result)}",
                         "success": False
                     }
+                    yield {"type": "agent", "agent_id": agent_id, **thinking_traces[agent_id]}
                 else:
-                    execution_id, response, thinking = result
+                    execution_id, response, thinking, completion = result
                     execution_ids.append(execution_id)
+                    completions.append(completion)
                     agent_responses[agent_id] = response
                     thinking_traces[agent_id] = {
                         "agent_name": self.agent_configs[agent_id]["name"],
                         "thinking": thinking,
                         "success": True
                     }
-                    successful_agents.append(agent_id)
+                    yield {"type": "agent", "agent_id": agent_id, "response": response, **thinking_traces[agent_id]}
+            
+            # Keep the requested agent order for the combined response
+            successful_agents = [agent_id for agent_id in agent_ids if agent_id in agent_responses]
             
             # Combine responses if multiple agents
             if len(successful_agents) == 1:
@@ -178,7 +205,7 @@ class AgentService:
             
             response_time = time.time() - start_time
             
-            return {
+            result = {
                 "success": True,
                 "response": final_response,
                 "agents_used": successful_agents,
@@ -191,7 +218,7 @@ class AgentService:
             response_time = time.time() - start_time
             logger.error(f"Agent processing failed: {e}")
             
-            return {
+            result = {
                 "success": False,
                 "error": str(e),
                 "response": f"Processing failed: {str(e)}",
@@ -199,6 +226,34 @@ class AgentService:
                 "thinking_traces": thinking_traces,
                 "response_time": response_time
             }
+        
+        finally:
+            # Stop agents still running if the consumer went away early
+            for task in tasks:
+                task.cancel()
+            
+            # Write every finished execution for this turn in one transaction
+            if completions:
+                self._record_completions(completions)
+        
+        yield {"type": "result", **result}
+    
+    def _record_completions(self, completions: List[Tuple[int, Dict[str, Any]]]):
+        """Mark finished executions completed and update their agents' performance"""
+        try:
+            with db.get_session() as session:
+                AgentExecution.bulk_mark_completed(session, [row for _, row in completions])
+                for agent_pk, row in completions:
+                    Agent.record_execution(session, agent_pk, row["response_time"], True)
+        except Exception as e:
+            logger.error(f"Failed to record agent executions: {e}")
+    
+    async def _execute_agent_tagged(self, agent_id: str, *args) -> Tuple[str, Any]:
+        """Run _execute_agent and return (agent_id, result or exception)"""
+        try:
+            return agent_id, await self._execute_agent(agent_id, *args)
+        except Exception as e:
+            return agent_id, e
     
     async def _execute_agent(
         self,
@@ -206,8 +261,14 @@ class AgentService:
         message: str,
         conversation_history: Optional[List[Dict]],
         conversation: Optional[Conversation]
-    ) -> Tuple[str, str, str]:
-        """Execute a single agent"""
+    ) -> Tuple[str, str, str, Tuple[int, Dict[str, Any]]]:
+        """
+        Execute a single agent
+        
+        Returns:
+            (execution_id, response, thinking_trace, completion), where completion is
+            the (agent primary key, execution mapping) pair for _record_completions
+        """
         
         # Get agent configuration
         agent_config = self.agent_configs.get(agent_id)
@@ -232,6 +293,8 @@ class AgentService:
             session.commit()
             
             execution_id = execution.execution_id
+            execution_pk = execution.id
+            agent_pk = agent.id
         
         try:
             endpoint = agent_config.get("endpoint")
@@ -271,27 +334,16 @@ class AgentService:
                 tokens_used = model_response.tokens_used
                 response_time = model_response.response_time
 
-            # Update execution record
-            with db.get_session() as session:
-                execution = session.query(AgentExecution).filter_by(
-                    execution_id=execution_id
-                ).first()
-
-                if execution:
-                    execution.mark_completed(
-                        response_time=response_time,
-                        tokens_used=tokens_used,
-                        thinking_trace={"thinking": thinking_trace}
-                    )
-
-                    # Update agent performance
-                    agent_db = session.query(Agent).get(execution.agent_id)
-                    if agent_db:
-                        agent_db.update_performance(response_time, True)
-
-                session.commit()
+            # The execution record is written with the rest of the turn
+            completion = {
+                "id": execution_pk,
+                "response_time": response_time,
+                "tokens_used": tokens_used,
+                "thinking_trace": {"thinking": thinking_trace},
+                "completed_at": datetime.utcnow()
+            }
 
-            return execution_id, content, thinking_trace
+            return execution_id, content, thinking_trace, (agent_pk, completion)
 
         except Exception as e:
             # Mark execution as failed
@@ -304,9 +356,7 @@ class AgentService:
                     execution.mark_failed(str(e))
 
                     # Update agent performance
-                    agent_db = session.query(Agent).get(execution.agent_id)
-                    if agent_db:
-                        agent_db.update_performance(0.0, False)
+                    Agent.record_execution(session, execution.agent_id, 0.0, False)
 
                 session.commit()
 
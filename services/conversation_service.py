@@ -2,12 +2,14 @@
 Conversation service for managing chat history and conversations
 """
 import uuid
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 from datetime import datetime
 
+from sqlalchemy import select
+
 from models.database import db
-from models.conversation import Conversation
+from models.conversation import Conversation, ConversationTurn
 from utils.security import SecurityUtils
 
 logger = logging.getLogger('juniorgpt.conversation_service')
@@ -26,12 +28,31 @@ class ConversationService:
         **kwargs
     ) -> Optional[str]:
         """Create a new conversation or add to existing one"""
+        conversation_id, _ = self.create_conversation_with_history(
+            user_input, agent_response, conversation_id, history_limit=0, **kwargs
+        )
+        return conversation_id
+    
+    def create_conversation_with_history(
+        self,
+        user_input: str,
+        agent_response: str,
+        conversation_id: Optional[str] = None,
+        history_limit: int = 50,
+        **kwargs
+    ) -> Tuple[Optional[str], List[ConversationTurn]]:
+        """
+        Add a conversation turn and read back the conversation history in one session
+        
+        Returns:
+            (conversation ID or None on failure, history as returned by get_conversation_turns)
+        """
         
         # Validate input
         is_valid, error_msg = self.security.validate_message_input(user_input)
         if not is_valid:
             logger.warning(f"Invalid user input: {error_msg}")
-            return None
+            return None, []
         
         try:
             with db.get_session() as session:
@@ -60,11 +81,16 @@ class ConversationService:
                 session.commit()
                 
                 logger.info(f"Created conversation: {conversation_id}")
-                return conversation_id
+                
+                history = []
+                if history_limit:
+                    history = self._query_turns(session, conversation_id, history_limit)
+                
+                return conversation_id, history
                 
         except Exception as e:
             logger.error(f"Failed to create conversation: {e}")
-            return None
+            return None, []
     
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Get conversation by ID"""
@@ -84,15 +110,37 @@ class ConversationService:
         """Get conversation history for a specific conversation"""
         try:
             with db.get_session() as session:
-                conversations = session.query(Conversation).filter_by(
-                    conversation_id=conversation_id
-                ).order_by(Conversation.created_at).limit(limit).all()
-                
+                conversations = self._query_history(session, conversation_id, limit)
                 return [conv.to_dict() for conv in conversations]
         except Exception as e:
             logger.error(f"Failed to get conversation history: {e}")
             return []
     
+    def get_conversation_turns(self, conversation_id: str, limit: int = 50) -> List[ConversationTurn]:
+        """Get just the user/agent text of a conversation's turns, for agent context"""
+        try:
+            with db.get_session() as session:
+                return self._query_turns(session, conversation_id, limit)
+        except Exception as e:
+            logger.error(f"Failed to get conversation turns: {e}")
+            return []
+    
+    def _query_turns(self, session, conversation_id: str, limit: int) -> List[ConversationTurn]:
+        """Select turn text in creation order as plain tuples, bypassing the identity map"""
+        rows = session.execute(
+            select(Conversation.user_input, Conversation.agent_response)
+            .where(Conversation.conversation_id == conversation_id)
+            .order_by(Conversation.created_at)
+            .limit(limit)
+        ).tuples()
+        return [ConversationTurn._make(row) for row in rows]
+    
+    def _query_history(self, session, conversation_id: str, limit: int) -> List[Conversation]:
+        """Query the turns of a conversation in creation order"""
+        return session.query(Conversation).filter_by(
+            conversation_id=conversation_id
+        ).order_by(Conversation.created_at).limit(limit).all()
+    
     def get_recent_conversations(
         self,
         limit: int = 20,
@@ -0,0 +1,74 @@
+"""
+Response cache for repeated chat messages
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger('juniorgpt.response_cache')
+
+class ResponseCache:
+    """
+    In-memory TTL + LRU cache of agent results
+    
+    Entries are keyed by the normalized message (case and whitespace folded,
+    trailing punctuation dropped) together with the agents that handled it,
+    so repeated questions skip the multi-agent fan-out entirely.
+    """
+    
+    def __init__(self, ttl: int = 86400, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Tuple[str, ...]], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(message: str, agent_ids: List[str]) -> Tuple[str, Tuple[str, ...]]:
+        """Build the cache key for a message and its agents"""
+        normalized = " ".join(message.lower().split()).rstrip("?!. ")
+        return normalized, tuple(sorted(agent_ids))
+    
+    def get(self, message: str, agent_ids: List[str]) -> Optional[Dict[str, Any]]:
+        """Get a cached result, or None if missing or expired"""
+        key = self.make_key(message, agent_ids)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def set(self, message: str, agent_ids: List[str], result: Dict[str, Any]):
+        """Cache a successful result"""
+        key = self.make_key(message, agent_ids)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
+        logger.info("Response cache cleared")
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache size and hit statistics"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0
+            }
@@ -0,0 +1,25 @@
+"""
+JSON encoding for stored conversation data
+
+Uses orjson when it is installed and falls back to the standard library.
+Decode errors from either backend are json.JSONDecodeError instances.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional; see requirements.txt
+    orjson = None
+
+def loads(data: Any) -> Any:
+    """Parse a JSON document from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj)
@@ -1,9 +1,11 @@
 """
 Logging configuration for JuniorGPT
 """
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 from typing import Optional
@@ -34,6 +36,25 @@ class ColoredFormatter(logging.Formatter):
             
         return super().format(record)
 
+class InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler passing records through unchanged to a listener in this process"""
+    
+    def prepare(self, record):
+        # Nothing is pickled, so keep args and exc_info for the real handlers' filters and formatters
+        return record
+
+# Background thread that runs the real handlers; replaced on each setup_logging call
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_queue_listener():
+    """Flush queued records and stop the listener thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
 class SecurityFilter(logging.Filter):
     """Filter to remove sensitive information from logs"""
     
@@ -68,6 +89,9 @@ def setup_logging(
     """
     Set up comprehensive logging configuration
     
+    Records are queued by the calling thread and written by a background
+    listener, so file and console I/O stays off the request path.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file (optional)
@@ -91,6 +115,8 @@ def setup_logging(
     
     # Clear existing handlers
     logger.handlers.clear()
+    _stop_queue_listener()
+    handlers = []
     
     # Create security filter
     security_filter = SecurityFilter()
@@ -109,7 +135,7 @@ def setup_logging(
         )
         file_handler.setFormatter(file_formatter)
         file_handler.addFilter(security_filter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
     # Console handler
     if include_console:
@@ -120,7 +146,7 @@ def setup_logging(
         )
         console_handler.setFormatter(console_formatter)
         console_handler.addFilter(security_filter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # Error handler (separate file for errors)
     if log_file:
@@ -139,7 +165,14 @@ def setup_logging(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         error_handler.setFormatter(error_formatter)
-        logger.addHandler(error_handler)
+        handlers.append(error_handler)
+    
+    # Route records through a queue to the handlers above
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(InProcessQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     return logger
 
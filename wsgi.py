@@ -0,0 +1,10 @@
+"""
+WSGI entry point for running JuniorGPT under a production server
+
+    gunicorn wsgi:application
+
+Settings are read from gunicorn.conf.py.
+"""
+from app import app
+
+application = app